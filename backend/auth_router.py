@@ -1,19 +1,33 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from prisma.prisma_client import Prisma
 from models import RegisterIn, LoginIn, UserOut
-from security import hash_password, verify_password, create_access_token
+from security import (
+    hash_password_async, verify_and_update_password_async, create_access_token,
+    HashPoolSaturated, hash_stats,
+)
 from dependencies import get_db
-from security_deps import get_current_user_email
+from security_deps import get_current_user, invalidate_user, require_admin
+from prisma.prisma_client.models import User
 
 router = APIRouter(tags=["auth"])
 
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many sign-ins in progress, try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
 @router.post("/register", response_model=UserOut, status_code=201)
 async def register(data: RegisterIn, db: Prisma = Depends(get_db)):
     try:
         existing = await db.user.find_unique(where={"email": data.email})
         if existing:
             raise HTTPException(status_code=400, detail="Email already registered")
-        hashed = hash_password(data.password)
+        try:
+            hashed = await hash_password_async(data.password)
+        except HashPoolSaturated:
+            raise _busy()
         user = await db.user.create(
             data={
                 "name": data.name,
@@ -21,8 +35,11 @@ async def register(data: RegisterIn, db: Prisma = Depends(get_db)):
                 "passwordHash": hashed,
             }
         )
+        invalidate_user(user.email)
         return UserOut(id=user.id, name=user.name, email=user.email)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Register failed: {str(e)}")
 
@@ -30,22 +47,35 @@ async def register(data: RegisterIn, db: Prisma = Depends(get_db)):
 @router.post("/login")
 async def login(data: LoginIn, db: Prisma = Depends(get_db)):
     user = await db.user.find_unique(where={"email": data.email})
-    if not user or not verify_password(data.password, user.passwordHash):
+    valid, new_hash = False, None
+    if user is not None:
+        try:
+            valid, new_hash = await verify_and_update_password_async(
+                data.password, user.passwordHash
+            )
+        except HashPoolSaturated:
+            raise _busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
-    token = create_access_token(user.email)
+    if new_hash:
+        await db.user.update(
+            where={"id": user.id},
+            data={"passwordHash": new_hash},
+        )
+        invalidate_user(user.email)
+
+    token = create_access_token(user.email, user.id)
     return {"access_token": token, "token_type": "bearer"}
 
 @router.get("/me")
-async def get_me(
-    user_email: str = Depends(get_current_user_email),
-    db: Prisma = Depends(get_db)
-):
-    user = await db.user.find_unique(where={"email": user_email})
-    if not user:
-        raise HTTPException(404, "User not found")
-
-    return {"id": user.id, "name": user.name, "email": user.email}
\ No newline at end of file
+async def get_me(user: User = Depends(get_current_user)):
+    return {"id": user.id, "name": user.name, "email": user.email}
+
+
+@router.get("/metrics/hashing")
+async def hashing_metrics(admin: str = Depends(require_admin)):
+    return hash_stats.snapshot()
@@ -0,0 +1,65 @@
+"""
+Compare model_parse (full pydantic validation) with trusted hydration on
+find_many sized results, with and without included relations.
+
+    cd backend && python benchmarks/bench_hydration.py
+"""
+import os, sys, timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prisma.prisma_client import models
+from prisma.prisma_client._compat import model_parse
+from prisma.prisma_client._hydration import hydrate_many
+
+N = 10
+
+
+def event_row(i, include):
+    row = {
+        "id": i,
+        "title": f"Event number {i}",
+        "description": "Lorem ipsum dolor sit amet",
+        "url": f"https://example.com/events/{i}",
+        "imageUrl": None,
+        "startTime": "2025-06-01T18:00:00.000Z",
+        "endTime": "2025-06-01T21:00:00.000Z",
+        "timezone": "Africa/Lagos",
+        "price": "12.50",
+        "isFree": False,
+        "venueId": i % 300,
+        "sourceId": i % 20,
+        "createdAt": "2025-05-01T09:30:00.000Z",
+        "updatedAt": "2025-05-02T09:30:00.000Z",
+    }
+    if include:
+        row["venue"] = {
+            "id": i % 300,
+            "name": "Venue",
+            "street": None,
+            "city": "Lagos",
+            "state": None,
+            "country": "NG",
+            "lat": 6,
+            "lng": 3.4,
+            "key": None,
+            "createdAt": "2025-05-01T09:30:00.000Z",
+        }
+        row["tags"] = [{"id": 1, "name": "music"}, {"id": 2, "name": "art"}]
+    return row
+
+
+def main():
+    for include in (False, True):
+        rows = [event_row(i, include) for i in range(10000)]
+        parse = min(timeit.repeat(lambda: [model_parse(models.Event, r) for r in rows], number=1, repeat=N))
+        trusted = min(timeit.repeat(lambda: hydrate_many(models.Event, rows), number=1, repeat=N))
+        label = "10k events + relations" if include else "10k events"
+        print(
+            f"{label:>22}: {parse * 1e3:8.2f} ms model_parse"
+            f"  {trusted * 1e3:8.2f} ms trusted  ({parse / trusted:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
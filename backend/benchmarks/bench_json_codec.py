@@ -0,0 +1,61 @@
+"""
+Compare the standard library json module with the client's JSON codec
+(orjson / msgspec when installed) on large find_many responses and on
+create_many request payloads.
+
+    cd backend && python benchmarks/bench_json_codec.py
+    cd backend && PRISMA_PY_JSON=json python benchmarks/bench_json_codec.py
+"""
+import os, sys, json, timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prisma.prisma_client import _json
+from prisma.prisma_client._builder import dumps, serializer
+
+N = 20
+
+
+def event_row(i):
+    return {
+        "id": i,
+        "title": f"Event number {i}",
+        "description": "Lorem ipsum dolor sit amet, " * 8,
+        "url": f"https://example.com/events/{i}",
+        "imageUrl": None,
+        "startTime": "2025-06-01T18:00:00.000Z",
+        "endTime": "2025-06-01T21:00:00.000Z",
+        "timezone": "Africa/Lagos",
+        "price": "12.50",
+        "isFree": False,
+        "venueId": i % 300,
+        "sourceId": i % 20,
+        "createdAt": "2025-05-01T09:30:00.000Z",
+        "updatedAt": "2025-05-02T09:30:00.000Z",
+    }
+
+
+def main():
+    print(f"backend: {_json.BACKEND}")
+    for rows in (1000, 10000):
+        body = json.dumps({"data": {"result": [event_row(i) for i in range(rows)]}}).encode()
+        std = timeit.timeit(lambda: json.loads(body), number=N)
+        fast = timeit.timeit(lambda: _json.loads(body), number=N)
+        print(
+            f"decode find_many {rows:>6} rows: {std / N * 1e3:8.2f} ms json"
+            f"  {fast / N * 1e3:8.2f} ms {_json.BACKEND}  ({std / fast:.1f}x)"
+        )
+
+    now = datetime.now(timezone.utc)
+    payload = {"data": [{**event_row(i), "startTime": now, "endTime": now} for i in range(1000)]}
+    std = timeit.timeit(lambda: json.dumps(payload, default=serializer, ensure_ascii=False), number=N)
+    fast = timeit.timeit(lambda: dumps(payload), number=N)
+    print(
+        f"encode create_many  1000 rows: {std / N * 1e3:8.2f} ms json"
+        f"  {fast / N * 1e3:8.2f} ms {_json.BACKEND}  ({std / fast:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Compare python-jose verification against security.decode_hs256 and the
+verified-token cache in security_deps.
+
+    cd backend && python benchmarks/bench_jwt.py
+"""
+import os, sys, timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from jose import jwt
+from security import JWT_SECRET, create_access_token, decode_hs256
+from security_deps import _payload_from_token
+
+N = 20000
+
+
+def main():
+    token = create_access_token("bench@example.com", 1)
+
+    def jose_decode():
+        jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+
+    cases = [
+        ("python-jose", jose_decode),
+        ("decode_hs256", lambda: decode_hs256(token)),
+        ("cached", lambda: _payload_from_token(token)),
+    ]
+    for name, fn in cases:
+        secs = timeit.timeit(fn, number=N)
+        print(f"{name:>14}: {secs / N * 1e6:8.2f} us/token")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Throughput of parse_event_async under each SCRAPE_PARSE_POOL mode, for pages
+that take the JSON-LD fast path and for pages that need the full soup. The
+process pool has to beat "thread" here, per uvicorn worker, before it is
+worth enabling.
+
+    cd backend && python benchmarks/bench_parse_pool.py
+"""
+import os, sys, time, asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import scraping
+
+PAGES = 200
+MODES = ("inline", "thread", "process")
+
+FILLER = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20 + "</p>"
+
+JSONLD_PAGE = """<html><head><title>Launch</title>
+<script type="application/ld+json">
+{"@type": "Event", "name": "Launch party", "startDate": "2025-06-01T18:00:00Z",
+ "location": {"name": "The Hall", "address": {"addressLocality": "Lagos"}},
+ "offers": {"price": "0"}}
+</script></head><body>%s</body></html>""" % (FILLER * 50)
+
+SOUP_PAGE = """<html><head><title>Launch party</title></head><body>
+<div>When: June 1, 2025</div><div>Venue: The Hall |</div>%s</body></html>""" % (FILLER * 50)
+
+
+async def run(html: str) -> float:
+    # the backpressure semaphore is bound to the loop that first waits on it
+    scraping._parse_slots = None
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        scraping.parse_event_async(html, f"https://example.com/e/{i}")
+        for i in range(PAGES)
+    ))
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{PAGES} pages, {scraping.PARSE_WORKERS} workers")
+    for name, html in (("json-ld", JSONLD_PAGE), ("soup", SOUP_PAGE)):
+        for mode in MODES:
+            scraping.PARSE_POOL = mode
+            asyncio.run(run(html))  # warm up the pool
+            elapsed = asyncio.run(run(html))
+            scraping.shutdown_parse_pool()
+            print(f"{name:>8} {mode:>8}: {elapsed * 1e3:8.1f} ms  ({PAGES / elapsed:7.0f} pages/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Per-hash latency for candidate password hashing parameters, to size login
+capacity (logins/sec per core ~= 1000 / verify ms).
+
+    cd backend && python benchmarks/bench_password_hash.py
+"""
+import os, sys, time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from security import build_pwd_context
+
+CANDIDATES = [
+    ("bcrypt rounds=10", {"schemes": ["bcrypt"], "bcrypt_rounds": 10}),
+    ("bcrypt rounds=12", {"schemes": ["bcrypt"], "bcrypt_rounds": 12}),
+    ("argon2id t=2 m=19MiB p=1", {
+        "schemes": ["argon2"], "argon2_time_cost": 2,
+        "argon2_memory_kib": 19456, "argon2_parallelism": 1,
+    }),
+    ("argon2id t=3 m=64MiB p=4", {
+        "schemes": ["argon2"], "argon2_time_cost": 3,
+        "argon2_memory_kib": 65536, "argon2_parallelism": 4,
+    }),
+]
+ROUNDS = 10
+
+
+def main():
+    for name, kwargs in CANDIDATES:
+        ctx = build_pwd_context(**kwargs)
+        hashed = ctx.hash("correct horse battery staple")
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            ctx.verify("correct horse battery staple", hashed)
+        ms = (time.perf_counter() - start) / ROUNDS * 1000
+        print(f"{name:>26}: {ms:8.1f} ms/verify  ~{1000 / ms:6.1f} logins/s/core")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare QueryBuilder.build() with and without the compiled query-template
+cache for the query shapes the routers issue most.
+
+    cd backend && python benchmarks/bench_query_builder.py
+"""
+import os, sys, timeit
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from prisma.prisma_client import _builder, models
+from prisma.prisma_client._builder import QueryBuilder
+from prisma.prisma_client.metadata import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+N = 20000
+
+NOW = datetime.now(timezone.utc)
+
+# Mirrors the queries in events_router.py and notifications_router.py
+CASES = [
+    ("find_unique", "find_unique", models.Event, lambda i: {"where": {"id": i}}),
+    (
+        "list events",
+        "find_many",
+        models.Event,
+        lambda i: {
+            "where": {
+                "AND": [
+                    {"startTime": {"gte": NOW}},
+                    {"venue": {"is": {"city": {"equals": "Lagos", "mode": "insensitive"}}}},
+                ]
+            },
+            "order_by": [{"startTime": "asc"}, {"id": "asc"}],
+            "take": 51,
+            "include": {"venue": True},
+        },
+    ),
+    (
+        "saved in page",
+        "find_many",
+        models.SavedEvent,
+        # the page length varies, the template is shared across lengths
+        lambda i: {"where": {"userId": 7, "eventId": {"in": list(range(i % 50 + 1))}}},
+    ),
+    (
+        "mark read",
+        "update_many",
+        models.Notification,
+        lambda i: {
+            "where": {"userId": 7, "readAt": None, "id": {"in": list(range(i % 50 + 1))}},
+            "data": {"readAt": NOW},
+        },
+    ),
+]
+
+
+def build(method, model, arguments):
+    return QueryBuilder(
+        method=method,
+        model=model,
+        arguments=arguments,
+        root_selection=["count"] if method == "update_many" else None,
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    ).build()
+
+
+def main():
+    size = _builder.QUERY_TEMPLATE_CACHE_SIZE
+    for name, method, model, make_arguments in CASES:
+        arguments = [make_arguments(i) for i in range(N)]
+        _builder.QUERY_TEMPLATE_CACHE_SIZE = 0
+        before = timeit.timeit(lambda: [build(method, model, a) for a in arguments], number=1)
+        _builder.QUERY_TEMPLATE_CACHE_SIZE = size
+        _builder.clear_query_templates()
+        after = timeit.timeit(lambda: [build(method, model, a) for a in arguments], number=1)
+        print(
+            f"{name:>16}: {before / N * 1e6:8.2f} us uncached"
+            f"  {after / N * 1e6:8.2f} us cached  ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,88 +1,69 @@
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+import json
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from prisma.prisma_client import Prisma
-from typing import List
+from prisma.prisma_client.errors import RecordNotFoundError
+from typing import List, Optional, Tuple
 from dependencies import get_db
-from security_deps import get_current_user_email
+from security_deps import get_current_user_id
 
-from models_events import ScrapeIn, EventOut, SaveEventIn
-from scraping import scrape_event
+from models_events import ScrapeIn, ScrapeBatchIn, EventOut, EventPage, SaveEventIn
+from scraping import scrape_event, scrape_many
+from notification_bus import bus
+from venues import forget_venue, resolve_venue_id, resolve_venue_ids, venue_key
+from sources import resolve_source_id, resolve_source_ids
+from tags import resolve_tag_ids, tag_relation
 
 
 router = APIRouter(prefix="/events", tags=["events"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+BATCH_UPSERT_SIZE = 25
+
 @router.post("/scrape", response_model=EventOut)
 async def scrape_and_upsert(
     payload: ScrapeIn,
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
 ):
-    user = await db.user.find_unique(where={"email": user_email})
-    existing = await db.event.find_unique(where={"url": str(payload.url)})
     data = await scrape_event(str(payload.url))
 
     if not data:
         raise HTTPException(500, "Scraper returned no data")
 
-    source = await db.eventsource.upsert(
-        where={"domain": data["source"]},
-        data={
-            "create": {"domain": data["source"], "label": data["source"]},
-            "update": {},
-        }
-    )
+    source_id = await resolve_source_id(db, data["source"])
 
-    v = data.get("venue") or {}
-    venue_id = None
-
-    if any(v.values()):
-        venue = await db.venue.create(
-            data={
-                "name": v.get("name"),
-                "street": v.get("street"),
-                "city": v.get("city"),
-                "state": v.get("state"),
-                "country": v.get("country"),
-                "lat": v.get("lat"),
-                "lng": v.get("lng"),
-            }
+    venue = data.get("venue") or {}
+    venue_id = await resolve_venue_id(db, venue)
+    tag_ids = await resolve_tag_ids(db, data.get("tags") or [])
+
+    async def upsert():
+        return await db.event.upsert(
+            where={"url": str(payload.url)},
+            data=_event_upsert_data(
+                str(payload.url), data, source_id, venue_id, list(tag_ids.values())
+            ),
+            include={"venue": True}
         )
-        venue_id = venue.id
-
-    ev = await db.event.upsert(
-        where={"url": str(payload.url)},
-        data={
-            "create": {
-                "title": data["title"],
-                "description": data.get("description"),
-                "url": str(payload.url),
-                "imageUrl": data.get("imageUrl"),
-                "startTime": data.get("startTime"),
-                "endTime": data.get("endTime"),
-                "timezone": data.get("timezone"),
-                "price": data.get("price"),
-                "isFree": data.get("isFree"),
-                "venueId": venue_id,
-                "sourceId": source.id,
-            },
-            "update": {
-                "title": data["title"],
-                "description": data.get("description"),
-                "imageUrl": data.get("imageUrl"),
-                "startTime": data.get("startTime"),
-                "endTime": data.get("endTime"),
-                "timezone": data.get("timezone"),
-                "price": data.get("price"),
-                "isFree": data.get("isFree"),
-                "venueId": venue_id,
-                "sourceId": source.id,
-            }
-        },
-        include={"venue": True}
-    )
+
+    try:
+        ev = await upsert()
+    except RecordNotFoundError:
+        # The cached venue id may belong to a row compact_venues merged away
+        forget_venue(venue)
+        venue_id = await resolve_venue_id(db, venue)
+        ev = await upsert()
     saved = await db.savedevent.find_first(
-        where={"userId": user.id, "eventId": ev.id}
+        where={"userId": user_id, "eventId": ev.id}
     )
 
+    return _event_out(ev, bool(saved))
+
+
+def _event_out(ev, saved: bool) -> EventOut:
     return EventOut(
         id=ev.id,
         title=ev.title,
@@ -98,98 +79,319 @@ async def scrape_and_upsert(
                 "state": ev.venue.state
             }
         ),
-        saved=bool(saved)
+        saved=saved
     )
 
 
-@router.get("", response_model=List[EventOut])
-async def list_events(
-    db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
-):
+def _event_upsert_data(
+    url: str,
+    data: dict,
+    source_id: int,
+    venue_id: Optional[int],
+    tag_ids: List[int],
+) -> dict:
+    fields = {
+        "title": data["title"],
+        "description": data.get("description"),
+        "imageUrl": data.get("imageUrl"),
+        "startTime": data.get("startTime"),
+        "endTime": data.get("endTime"),
+        "timezone": data.get("timezone"),
+        "price": data.get("price"),
+        "isFree": data.get("isFree"),
+        "source": {"connect": {"id": source_id}},
+    }
+    # A scrape that finds no venue leaves a previously known one in place
+    # rather than clearing it, on both the single and the batch path.
+    if venue_id is not None:
+        fields["venue"] = {"connect": {"id": venue_id}}
+    tags = tag_relation(tag_ids)
+    return {
+        "create": {**fields, "url": url, **tags["create"]},
+        "update": {**fields, **tags["update"]},
+    }
+
+
+async def upsert_scraped_events(db: Prisma, scraped: list) -> None:
+    """
+    Upsert a chunk of (url, scraped data) pairs: one batched transaction each
+    for any sources, venues and tags not already cached, and one for the
+    events themselves.
+    """
+    try:
+        await _upsert_scraped_chunk(db, scraped)
+    except RecordNotFoundError:
+        # A cached venue id may belong to a row compact_venues merged away;
+        # re-resolve the chunk's venues and try once more.
+        for _, data in scraped:
+            forget_venue(data.get("venue") or {})
+        await _upsert_scraped_chunk(db, scraped)
+
+
+async def _upsert_scraped_chunk(db: Prisma, scraped: list) -> None:
+    sources = await resolve_source_ids(db, [data["source"] for _, data in scraped])
+    venues = await resolve_venue_ids(
+        db, [data.get("venue") or {} for _, data in scraped]
+    )
+    tags = await resolve_tag_ids(
+        db, [t for _, data in scraped for t in data.get("tags") or []]
+    )
+
+    async with db.batch_() as batch:
+        for url, data in scraped:
+            batch.event.upsert(
+                where={"url": url},
+                data=_event_upsert_data(
+                    url,
+                    data,
+                    sources[data["source"]],
+                    venues.get(venue_key(data.get("venue") or {})),
+                    [tags[t] for t in data.get("tags") or []],
+                ),
+            )
+
+
+async def upsert_scraped_rows(db: Prisma, scraped: list) -> List[Tuple[str, Exception]]:
+    """
+    Upsert a chunk with upsert_scraped_events. The chunk is written in one
+    transaction, so if it fails its rows are retried one at a time and only
+    the ones that fail on their own are returned, as (url, error) pairs.
+    """
+    try:
+        await upsert_scraped_events(db, scraped)
+        return []
+    except Exception as e:
+        if len(scraped) == 1:
+            return [(scraped[0][0], e)]
+    failed = []
+    for row in scraped:
+        failed += await upsert_scraped_rows(db, [row])
+    return failed
+
+
+async def _upsert_scraped(
+    db: Prisma, user_id: int, scraped: list
+) -> Tuple[List[EventOut], List[Tuple[str, Exception]]]:
+    """
+    Upsert a chunk of scraped events and return the ones written, re-read in
+    a single query, along with the (url, error) pairs that failed.
+    """
+    failed = await upsert_scraped_rows(db, scraped)
+    failed_urls = {url for url, _ in failed}
+    urls = [url for url, _ in scraped if url not in failed_urls]
+    if not urls:
+        return [], failed
 
-    user = await db.user.find_unique(where={"email": user_email})
     rows = await db.event.find_many(
+        where={"url": {"in": urls}},
         include={"venue": True},
-        order={"startTime": "asc"}
     )
-
     saved_ids = set([
         s.eventId for s in await db.savedevent.find_many(
-            where={"userId": user.id}
+            where={"userId": user_id, "eventId": {"in": [ev.id for ev in rows]}}
         )
     ])
+    return [_event_out(ev, ev.id in saved_ids) for ev in rows], failed
 
-    out = []
-    for ev in rows:
-        out.append(
-            EventOut(
-                id=ev.id,
-                title=ev.title,
-                url=ev.url,
-                imageUrl=ev.imageUrl,
-                startTime=ev.startTime,
-                endTime=ev.endTime,
-                venue=(
-                    ev.venue and {
-                        "id": ev.venue.id,
-                        "name": ev.venue.name,
-                        "city": ev.venue.city,
-                        "state": ev.venue.state
-                    }
-                ),
-                saved=(ev.id in saved_ids)
-            )
-        )
 
-    return out
+def _status_line(url: str, ok: bool, **extra) -> str:
+    return json.dumps({"url": url, "ok": ok, **extra}, default=str) + "\n"
 
 
-@router.post("/save")
-async def save_event(
-    payload: SaveEventIn,
+def _encode_cursor(ev) -> str:
+    start = ev.startTime.isoformat() if ev.startTime else ""
+    raw = f"{start}|{ev.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        start, ev_id = raw.rsplit("|", 1)
+        return (datetime.fromisoformat(start) if start else None), int(ev_id)
+    except Exception:
+        raise HTTPException(400, "Invalid cursor")
+
+
+def _after_cursor(start: Optional[datetime], ev_id: int) -> dict:
+    # Rows are ordered by (startTime ASC NULLS LAST, id ASC), so the page
+    # after a dated row also includes every undated row.
+    if start is None:
+        return {"startTime": None, "id": {"gt": ev_id}}
+    return {
+        "OR": [
+            {"startTime": {"gt": start}},
+            {"startTime": start, "id": {"gt": ev_id}},
+            {"startTime": None},
+        ]
+    }
+
+
+@router.post("/scrape/batch")
+async def scrape_batch(
+    payload: ScrapeBatchIn,
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
 ):
+    """
+    Scrape many URLs concurrently and stream one NDJSON status line per URL
+    as results are upserted.
+    """
+    urls = list(dict.fromkeys(str(u) for u in payload.urls))
 
-    user = await db.user.find_unique(where={"email": user_email})
+    async def flush(pending: list):
+        try:
+            events, failed = await _upsert_scraped(db, user_id, pending)
+        except Exception as e:
+            for url, _ in pending:
+                yield _status_line(url, False, error=f"Upsert failed: {e}")
+            return
+        for url, e in failed:
+            yield _status_line(url, False, error=f"Upsert failed: {e}")
+        for ev in events:
+            yield _status_line(ev.url, True, event=ev.model_dump())
 
-    ev = await db.event.find_unique(where={"id": payload.eventId})
-    if not ev:
-        raise HTTPException(404, "Event not found")
-    
-    already_saved = await db.savedevent.find_first(
-        where={"userId": user.id, "eventId": ev.id}
+    async def stream():
+        pending = []
+        async for url, data, err in scrape_many(urls, payload.concurrency):
+            if err is not None or not data:
+                yield _status_line(url, False, error=str(err or "Scraper returned no data"))
+                continue
+            pending.append((url, data))
+            if len(pending) >= BATCH_UPSERT_SIZE:
+                async for line in flush(pending):
+                    yield line
+                pending = []
+        if pending:
+            async for line in flush(pending):
+                yield line
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("", response_model=EventPage)
+async def list_events(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    city: Optional[str] = None,
+    source: Optional[str] = None,
+    is_free: Optional[bool] = Query(None, alias="isFree"),
+    tags: Optional[str] = Query(None, description="Comma-separated tag names; matches any"),
+    db: Prisma = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+
+    filters = []
+    if start or end:
+        window = {}
+        if start:
+            window["gte"] = start
+        if end:
+            window["lt"] = end
+        filters.append({"startTime": window})
+    if city:
+        filters.append(
+            {"venue": {"is": {"city": {"equals": city, "mode": "insensitive"}}}}
+        )
+    if source:
+        filters.append({"source": {"is": {"domain": source}}})
+    if is_free is not None:
+        filters.append({"isFree": is_free})
+    if tags:
+        names = [t.strip() for t in tags.split(",") if t.strip()]
+        if names:
+            filters.append({"tags": {"some": {"name": {"in": names}}}})
+    if cursor:
+        filters.append(_after_cursor(*_decode_cursor(cursor)))
+
+    rows = await db.event.find_many(
+        where={"AND": filters},
+        include={"venue": True},
+        order=[{"startTime": "asc"}, {"id": "asc"}],
+        take=limit + 1,
     )
-    await db.savedevent.upsert(
-        where={"userId_eventId": {"userId": user.id, "eventId": ev.id}},
-        data={
-            "create": {"userId": user.id, "eventId": ev.id},
-            "update": {}
-        }
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    saved_ids = set()
+    if rows:
+        saved_ids = set([
+            s.eventId for s in await db.savedevent.find_many(
+                where={
+                    "userId": user_id,
+                    "eventId": {"in": [ev.id for ev in rows]},
+                }
+            )
+        ])
+
+    return EventPage(
+        events=[_event_out(ev, ev.id in saved_ids) for ev in rows],
+        nextCursor=_encode_cursor(rows[-1]) if has_more else None,
     )
-    if not already_saved:
-        await db.notification.create(
-            data={
-                "userId": user.id,
-                "eventId": ev.id,
-                "type": "EVENT_SAVED",
-                "message": f"You saved '{ev.title}'."
-            }
+
+
+@router.post("/save")
+async def save_event(
+    payload: SaveEventIn,
+    db: Prisma = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Save an event and, only if the save is new, record an EVENT_SAVED
+    notification, all in one statement. No row back means the event
+    does not exist.
+    """
+    rows = await db.query_raw(
+        """
+        WITH ev AS (
+            SELECT "id", "title" FROM "Event" WHERE "id" = $2
+        ), saved AS (
+            INSERT INTO "SavedEvent" ("userId", "eventId")
+            SELECT $1, ev."id" FROM ev
+            ON CONFLICT ("userId", "eventId") DO NOTHING
+            RETURNING "eventId"
+        ), notif AS (
+            INSERT INTO "Notification" ("userId", "eventId", "type", "message")
+            SELECT $1, ev."id", 'EVENT_SAVED'::"NotificationType",
+                   format('You saved ''%s''.', ev."title")
+            FROM ev JOIN saved ON saved."eventId" = ev."id"
+            ON CONFLICT ("userId", "eventId", "type") DO NOTHING
+            RETURNING "id", "message", "createdAt"
         )
+        SELECT ev."id" AS "eventId", notif."id" AS "notificationId",
+               notif."message", notif."createdAt"
+        FROM ev LEFT JOIN notif ON true
+        """,
+        user_id,
+        payload.eventId,
+    )
+    if not rows:
+        raise HTTPException(404, "Event not found")
+
+    row = rows[0]
+    if row["notificationId"] is not None:
+        bus.publish(user_id, {
+            "id": row["notificationId"],
+            "userId": user_id,
+            "eventId": row["eventId"],
+            "type": "EVENT_SAVED",
+            "message": row["message"],
+            "createdAt": row["createdAt"],
+        })
     return {"ok": True}
 
 @router.delete("/save/{event_id}")
 async def unsave_event(
     event_id: int,
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
 ):
 
-    user = await db.user.find_unique(where={"email": user_email})
-
     row = await db.savedevent.find_first(
-        where={"userId": user.id, "eventId": event_id}
+        where={"userId": user_id, "eventId": event_id}
     )
 
     if row:
@@ -201,33 +403,12 @@ async def unsave_event(
 @router.get("/saved", response_model=List[EventOut])
 async def list_saved(
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
 ):
 
-    user = await db.user.find_unique(where={"email": user_email})
-
     saved = await db.savedevent.find_many(
-        where={"userId": user.id},
+        where={"userId": user_id},
         include={"event": {"include": {"venue": True}}}
     )
 
-    return [
-        EventOut(
-            id=s.event.id,
-            title=s.event.title,
-            url=s.event.url,
-            imageUrl=s.event.imageUrl,
-            startTime=s.event.startTime,
-            endTime=s.event.endTime,
-            venue=(
-                s.event.venue and {
-                    "id": s.event.venue.id,
-                    "name": s.event.venue.name,
-                    "city": s.event.venue.city,
-                    "state": s.event.venue.state
-                }
-            ),
-            saved=True
-        )
-        for s in saved
-    ]
+    return [_event_out(s.event, True) for s in saved]
@@ -1,15 +1,28 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from auth_router import router as auth_router
 from events_router import router as events_router
 from notifications_router import router as notifications_router
 from db import db
+from scraping import close_client, shutdown_parse_pool
+from refresh import REFRESH_ENABLED, run_refresh_loop
+from sources import warm_source_cache
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await db.connect()
+    await warm_source_cache(db)
+    refresher = asyncio.create_task(run_refresh_loop(db)) if REFRESH_ENABLED else None
     yield
+    if refresher:
+        # Let an in-flight pass unwind before its client, pool and db go away
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+    await close_client()
+    shutdown_parse_pool()
     await db.disconnect()
 
 app = FastAPI(title="EventHub API", lifespan=lifespan)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, HttpUrl
-from typing import Optional
+from pydantic import BaseModel, HttpUrl, Field
+from typing import Optional, List
 from datetime import datetime
 
 
@@ -7,6 +7,11 @@ class ScrapeIn(BaseModel):
     url: HttpUrl
 
 
+class ScrapeBatchIn(BaseModel):
+    urls: List[HttpUrl] = Field(..., min_length=1, max_length=1000)
+    concurrency: int = Field(16, ge=1, le=64)
+
+
 class VenueOut(BaseModel):
     id: int
     name: Optional[str] = None
@@ -25,5 +30,10 @@ class EventOut(BaseModel):
     saved: bool = False
 
 
+class EventPage(BaseModel):
+    events: List[EventOut]
+    nextCursor: Optional[str] = None
+
+
 class SaveEventIn(BaseModel):
     eventId: int
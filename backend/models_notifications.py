@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+from typing import Optional, List
+
+
+class MarkReadIn(BaseModel):
+    ids: Optional[List[int]] = Field(None, max_length=1000)
+    before: Optional[int] = None
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Any, Dict, Set
+
+QUEUE_SIZE = 100
+
+
+class NotificationBus:
+    """
+    In-process fan-out of new notifications to connected stream clients.
+    Only clients attached to this worker process receive a publish, so the
+    stream is a push hint on top of GET /notifications, not a replacement.
+    """
+
+    def __init__(self, queue_size: int = QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subs: Dict[int, Set[asyncio.Queue]] = {}
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subs.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue) -> None:
+        subs = self._subs.get(user_id)
+        if subs is None:
+            return
+        subs.discard(queue)
+        if not subs:
+            del self._subs[user_id]
+
+    def publish(self, user_id: int, payload: Dict[str, Any]) -> None:
+        for queue in self._subs.get(user_id, ()):
+            if queue.full():
+                # Slow consumer: drop the oldest message rather than block
+                # the publisher.
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+
+bus = NotificationBus()
@@ -1,38 +1,176 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from prisma.prisma_client import Prisma
-from datetime import datetime, timedelta, timezone
+from typing import Optional
+from datetime import date, datetime, timedelta, timezone
 from dependencies import get_db
-from security_deps import get_current_user_email
+from models_notifications import MarkReadIn
+from security import STREAM_TICKET_SECONDS, create_stream_ticket
+from security_deps import get_current_user_id, get_stream_user_id
+from notification_bus import bus
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+STREAM_KEEPALIVE_SECONDS = 15
+
+
 @router.get("")
 async def list_notifications(
+    cursor: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Prisma = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Newest-first page of notifications. `cursor` is the id of the last
+    notification of the previous page; the keyset walks the
+    (userId, createdAt) index and only the event fields the UI shows are read.
+    """
+    rows = await db.query_raw(
+        """
+        SELECT n."id", n."type", n."message", n."createdAt", n."readAt",
+               n."eventId", e."title" AS "eventTitle",
+               e."startTime" AS "eventStartTime"
+        FROM "Notification" n
+        LEFT JOIN "Event" e ON e."id" = n."eventId"
+        WHERE n."userId" = $1
+          AND ($2::int IS NULL OR (n."createdAt", n."id") < (
+                SELECT c."createdAt", c."id" FROM "Notification" c
+                WHERE c."id" = $2 AND c."userId" = $1))
+        ORDER BY n."createdAt" DESC, n."id" DESC
+        LIMIT $3
+        """,
+        user_id,
+        cursor,
+        limit + 1,
+    )
+
+    if cursor is not None and not rows:
+        # An unknown or foreign cursor matches nothing in the keyset
+        # comparison; tell it apart from a genuinely empty last page.
+        owned = await db.notification.count(where={"id": cursor, "userId": user_id})
+        if not owned:
+            raise HTTPException(400, "Invalid cursor")
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    notifs = [
+        {
+            "id": r["id"],
+            "type": r["type"],
+            "message": r["message"],
+            "createdAt": r["createdAt"],
+            "readAt": r["readAt"],
+            "eventId": r["eventId"],
+            "event": {
+                "id": r["eventId"],
+                "title": r["eventTitle"],
+                "startTime": r["eventStartTime"],
+            } if r["eventId"] is not None else None,
+        }
+        for r in rows
+    ]
+
+    return {
+        "notifications": notifs,
+        "nextCursor": rows[-1]["id"] if has_more else None,
+    }
+
+
+@router.get("/unread-count")
+async def unread_count(
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
+):
+    count = await db.notification.count(
+        where={"userId": user_id, "readAt": None}
+    )
+
+    return {"count": count}
+
+
+@router.post("/stream-ticket")
+async def stream_ticket(user_id: int = Depends(get_current_user_id)):
+    """
+    Short-lived ticket for opening GET /notifications/stream?ticket=...
+    """
+    return {"ticket": create_stream_ticket(user_id), "expiresIn": STREAM_TICKET_SECONDS}
+
+
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    user_id: int = Depends(get_stream_user_id)
 ):
-    user = await db.user.find_unique(where={"email": user_email})
+    """
+    Server-Sent Events stream of new notifications for the current user,
+    fed by the in-process notification bus.
+    """
+    queue = bus.subscribe(user_id)
+
+    async def events():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), timeout=STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: notification\ndata: {json.dumps(payload, default=str)}\n\n"
+        finally:
+            bus.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    notifs = await db.notification.find_many(
-        where={"userId": user.id},
-        order={"createdAt": "desc"},
-        take=50,
-        include={"event": True},
+
+@router.post("/read")
+async def mark_notifications_read(
+    payload: MarkReadIn,
+    db: Prisma = Depends(get_db),
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    Mark either the listed ids, or every notification up to and including
+    the `before` id, as read in a single statement.
+    """
+    if payload.ids is None and payload.before is None:
+        raise HTTPException(status_code=400, detail="Provide ids or before")
+
+    where = {"userId": user_id, "readAt": None}
+    if payload.ids is not None:
+        where["id"] = {"in": payload.ids}
+    else:
+        where["id"] = {"lte": payload.before}
+
+    updated = await db.notification.update_many(
+        where=where,
+        data={"readAt": datetime.now(timezone.utc)},
     )
 
-    return {"notifications": notifs}
+    return {"ok": True, "updated": updated}
 
 
 @router.post("/{notif_id}/read")
 async def mark_notification_read(
     notif_id: int,
     db: Prisma = Depends(get_db),
-    user_email: str = Depends(get_current_user_email)
+    user_id: int = Depends(get_current_user_id)
 ):
-    user = await db.user.find_unique(where={"email": user_email})
 
     notif = await db.notification.find_unique(where={"id": notif_id})
-    if not notif or notif.userId != user.id:
+    if not notif or notif.userId != user_id:
         raise HTTPException(status_code=404, detail="Notification not found")
 
     await db.notification.update(
@@ -42,99 +180,53 @@ async def mark_notification_read(
 
     return {"ok": True}
 
-async def generate_upcoming_notifications(db: Prisma) -> None:
-    now = datetime.now(timezone.utc)
-    today = now.date()
+UPCOMING_WINDOWS = [
+    # (days from today, notification type, message format; %s is the title)
+    (14, "EVENT_UPCOMING_14", "Reminder: '%s' is in 2 weeks."),
+    (7, "EVENT_UPCOMING_7", "Reminder: '%s' is in 7 days."),
+    (1, "EVENT_UPCOMING_1", "Reminder: '%s' is in 1 day."),
+    (-1, "EVENT_PAST", "'%s' has already passed."),
+]
+
+
+async def _notify_window(
+    tx: Prisma, day: date, notif_type: str, template: str
+) -> list:
+    """
+    Insert one window's reminders in a single statement and return only the
+    rows it actually created. Already-notified (userId, eventId, type) rows
+    are dropped by the unique index, so concurrent runs can't both report
+    the same notification.
+    """
+    return await tx.query_raw(
+        """
+        INSERT INTO "Notification" ("userId", "eventId", "type", "message")
+        SELECT s."userId", s."eventId", $1::"NotificationType", format($2, e."title")
+        FROM "SavedEvent" s
+        JOIN "Event" e ON e."id" = s."eventId"
+        WHERE e."startTime" >= $3::date AND e."startTime" < $3::date + 1
+        ON CONFLICT ("userId", "eventId", "type") DO NOTHING
+        RETURNING "id", "userId", "eventId", "type", "message", "createdAt"
+        """,
+        notif_type,
+        template,
+        day.isoformat(),
+    )
 
-    targets = {
-        14: "EVENT_UPCOMING_14",
-        7: "EVENT_UPCOMING_7",
-        1: "EVENT_UPCOMING_1",
-    }
 
-    for days_ahead, notif_type in targets.items():
-        target_date = today + timedelta(days=days_ahead)
-
-        start_dt = datetime.combine(
-            target_date, datetime.min.time(), tzinfo=timezone.utc
-        )
-        end_dt = start_dt + timedelta(days=1)
-
-        saved_events = await db.savedevent.find_many(
-            where={
-                "event": {
-                    "startTime": {
-                        "gte": start_dt,
-                        "lt": end_dt,
-                    }
-                }
-            },
-            include={"event": True},
-        )
-
-        for saved in saved_events:
-            exists = await db.notification.find_first(
-                where={
-                    "userId": saved.userId,
-                    "eventId": saved.eventId,
-                    "type": notif_type,
-                }
-            )
-            if exists:
-                continue
-
-            if days_ahead == 14:
-                msg = "in 2 weeks"
-            elif days_ahead == 7:
-                msg = "in 7 days"
-            else:
-                msg = "in 1 day"
-
-            await db.notification.create(
-                data={
-                    "userId": saved.userId,
-                    "eventId": saved.eventId,
-                    "type": notif_type,
-                    "message": f"Reminder: '{saved.event.title}' is {msg}.",
-                }
-            )
-    yesterday = today - timedelta(days=1)
-    y_start = datetime.combine(
-        yesterday, datetime.min.time(), tzinfo=timezone.utc
-    )
-    y_end = y_start + timedelta(days=1)
+async def generate_upcoming_notifications(db: Prisma) -> None:
+    today = datetime.now(timezone.utc).date()
 
-    past_saved = await db.savedevent.find_many(
-        where={
-            "event": {
-                "startTime": {
-                    "gte": y_start,
-                    "lt": y_end,
-                }
-            }
-        },
-        include={"event": True},
-    )
+    created = []
+    async with db.tx(timeout=timedelta(seconds=60)) as tx:
+        for days_ahead, notif_type, template in UPCOMING_WINDOWS:
+            created += await _notify_window(
+                tx, today + timedelta(days=days_ahead), notif_type, template
+            )
 
-    for saved in past_saved:
-        exists = await db.notification.find_first(
-            where={
-                "userId": saved.userId,
-                "eventId": saved.eventId,
-                "type": "EVENT_PAST",
-            }
-        )
-        if exists:
-            continue
-
-        await db.notification.create(
-            data={
-                "userId": saved.userId,
-                "eventId": saved.eventId,
-                "type": "EVENT_PAST",
-                "message": f"'{saved.event.title}' has already passed.",
-            }
-        )
+    # Published only once committed, in the same shape as save_event's
+    for row in created:
+        bus.publish(row["userId"], row)
 
 @router.post("/run-daily")
 async def run_daily_notifications(
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "Event_startTime_id_idx" ON "Event"("startTime", "id");
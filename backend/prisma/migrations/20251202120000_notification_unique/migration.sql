@@ -0,0 +1,10 @@
+-- Remove duplicate notifications left behind by the old read-before-write check
+DELETE FROM "Notification" a
+USING "Notification" b
+WHERE a."id" > b."id"
+  AND a."userId" = b."userId"
+  AND a."eventId" = b."eventId"
+  AND a."type" = b."type";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Notification_userId_eventId_type_key" ON "Notification"("userId", "eventId", "type");
@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "Notification_userId_unread_idx" ON "Notification"("userId") WHERE "readAt" IS NULL;
@@ -0,0 +1,5 @@
+-- AlterTable
+ALTER TABLE "Venue" ADD COLUMN "key" TEXT;
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Venue_key_key" ON "Venue"("key");
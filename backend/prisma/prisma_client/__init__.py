@@ -12,6 +12,7 @@ from . import errors as errors
 from .utils import setup_logging
 from ._types import PrismaMethod as PrismaMethod
 from ._config import config as config
+from ._query_log import configure_query_logging as configure_query_logging
 from ._metrics import (
     Metric as Metric,
     Metrics as Metrics,
@@ -4,6 +4,7 @@ from typing_extensions import override
 
 import httpx
 
+from ._json import loads
 from ._types import Method
 from .http_abstract import AbstractHTTP, AbstractResponse
 
@@ -61,7 +62,10 @@ class Response(AbstractResponse[httpx.Response]):
 
     @override
     async def json(self, **kwargs: Any) -> Any:
-        return json.loads(await self.original.aread(), **kwargs)
+        content = await self.original.aread()
+        if kwargs:
+            return json.loads(content, **kwargs)
+        return loads(content)
 
     @override
     async def text(self, **kwargs: Any) -> str:
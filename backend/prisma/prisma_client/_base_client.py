@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import warnings
 from types import TracebackType
-from typing import Any, Generic, TypeVar, overload
+from typing import Any, Generic, TypeVar, Iterable, overload
 from pathlib import Path
 from datetime import timedelta
 from typing_extensions import Self, Literal
@@ -20,6 +20,7 @@ from .engine import (
 )
 from .errors import ClientNotConnectedError, ClientNotRegisteredError
 from ._compat import model_parse, removeprefix
+from ._hydration import hydrate, hydrate_many
 from ._builder import QueryBuilder
 from ._metrics import Metrics
 from ._registry import get_client
@@ -68,10 +69,12 @@ def load_env(*, override: bool = False, **kwargs: Any) -> None:
 
 
 _EngineT = TypeVar('_EngineT', bound=BaseAbstractEngine)
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
 
 
 class BasePrisma(Generic[_EngineT]):
     _log_queries: bool
+    _trusted_hydration: bool
     _datasource: DatasourceOverride | None
     _connect_timeout: int | timedelta
     _tx_id: TransactionId | None
@@ -93,6 +96,7 @@ class BasePrisma(Generic[_EngineT]):
         '_datasource',
         '_log_queries',
         '_http_config',
+        '_trusted_hydration',
         '_schema_path',
         '_engine_type',
         '_prisma_models',
@@ -112,11 +116,13 @@ class BasePrisma(Generic[_EngineT]):
         datasource: DatasourceOverride | None,
         connect_timeout: int | timedelta,
         http: HttpConfig | None,
+        trusted_hydration: bool = False,
     ) -> None:
         # NOTE: if you add any more properties here then you may also need to forward
         # them in the `_copy()` method.
         self._internal_engine = None
         self._log_queries = log_queries
+        self._trusted_hydration = trusted_hydration
         self._datasource = datasource
 
         if isinstance(connect_timeout, int):
@@ -212,6 +218,7 @@ class BasePrisma(Generic[_EngineT]):
             datasource=self._datasource,
             log_queries=self._log_queries,
             connect_timeout=self._connect_timeout,
+            trusted_hydration=self._trusted_hydration,
         )
         new._copied = True
 
@@ -272,6 +279,20 @@ class BasePrisma(Generic[_EngineT]):
 
         return timeout, datasources
 
+    def _parse_model(self, model: type[_ModelT], data: Any) -> _ModelT:
+        """Create a model instance from a query engine result.
+
+        The result is only validated if the client was not created with `trusted_hydration=True`.
+        """
+        if self._trusted_hydration:
+            return hydrate(model, data)
+        return model_parse(model, data)
+
+    def _parse_models(self, model: type[_ModelT], data: Iterable[Any]) -> list[_ModelT]:
+        if self._trusted_hydration:
+            return hydrate_many(model, data)
+        return [model_parse(model, row) for row in data]
+
     def _make_query_builder(
         self,
         *,
@@ -408,7 +429,8 @@ class SyncBasePrisma(BasePrisma[SyncAbstractEngine]):
         builder = self._make_query_builder(
             method=method, model=model, arguments=arguments, root_selection=root_selection
         )
-        return self._engine.query(builder.build(), tx_id=self._tx_id)
+        content = builder.build()
+        return self._engine.query(content, tx_id=self._tx_id, trace=builder.trace)
 
 
 class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
@@ -530,4 +552,5 @@ class AsyncBasePrisma(BasePrisma[AsyncAbstractEngine]):
         builder = self._make_query_builder(
             method=method, model=model, arguments=arguments, root_selection=root_selection
         )
-        return await self._engine.query(builder.build(), tx_id=self._tx_id)
+        content = builder.build()
+        return await self._engine.query(content, tx_id=self._tx_id, trace=builder.trace)
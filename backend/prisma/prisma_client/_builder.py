@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import re
 import json
 import decimal
 import inspect
 import logging
 import datetime
+import itertools
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Union, Mapping, Iterable, ForwardRef, cast
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Union, Mapping, Callable, Iterable, Iterator, ForwardRef, Hashable, cast
 from datetime import timezone
-from textwrap import indent
 from functools import singledispatch
 from typing_extensions import Literal, TypeGuard, override
 
@@ -20,7 +22,9 @@ from ._types import PrismaMethod
 from .errors import InvalidModelError, UnknownModelError, UnknownRelationalFieldError
 from ._compat import get_args, is_union, get_origin, model_fields, model_field_type
 from ._typing import is_list_type
+from ._json import make_encoder
 from ._constants import QUERY_BUILDER_ALIASES
+from ._query_log import QueryTrace, start_trace
 
 if TYPE_CHECKING:
     from .bases import _PrismaModel as PrismaModel  # noqa: TID251
@@ -73,6 +77,11 @@ METHOD_FORMAT_MAPPING: dict[PrismaMethod, str] = {
     'find_unique_or_raise': 'findUnique{model}OrThrow',
 }
 
+RAW_METHODS: frozenset[PrismaMethod] = frozenset({'query_raw', 'query_first', 'execute_raw'})
+
+QUERY_TEMPLATE_CACHE_SIZE = 512
+"""Maximum number of compiled query templates to keep, 0 disables the cache"""
+
 MISSING = object()
 Operation = Literal['query', 'mutation']
 
@@ -121,6 +130,7 @@ class QueryBuilder:
         'root_selection',
         'prisma_models',
         'relational_field_mappings',
+        'trace',
     )
 
     def __init__(
@@ -141,6 +151,7 @@ class QueryBuilder:
         self.relational_field_mappings = relational_field_mappings
         self.arguments = args = self._transform_aliases(arguments)
         self.include = args.pop('include', None)
+        self.trace: QueryTrace | None = None
 
         # Note: we ignore the `model` argument for raw queries as users may want to pass in a model
         # that isn't a `PrismaModel` because they've defined it manually & enforcing that
@@ -154,17 +165,25 @@ class QueryBuilder:
             self.model = model
 
     def build(self) -> str:
-        """Build the payload that should be sent to the QueryEngine"""
+        """Build the payload that should be sent to the QueryEngine
+
+        This is where the request is sampled for query logging, the decision is kept
+        in `trace` which should then be passed to `engine.query()`.
+        """
+        self.trace = trace = start_trace(log)
         data: dict[str, object] = {
             'variables': {},
             'operation_name': self.operation,
-            'query': self.build_query(),
+            'query': self.build_query(trace),
         }
         return dumps(data)
 
-    def build_query(self) -> str:
+    def build_query(self, trace: QueryTrace | None = None) -> str:
         """Build the GraphQL query
 
+        The query is rendered on a single line unless `trace` logs it in full,
+        in which case it is indented for readability.
+
         Example query:
 
         query {
@@ -185,10 +204,91 @@ class QueryBuilder:
           }
         }
         """
-        query = self._create_root_node().render()
-        log.debug('Generated query: \n%s', query)
+        query = self._render_from_template(pretty=trace is not None and trace.full)
+        if trace is not None:
+            trace.query(log, query)
         return query
 
+    def _render(self, *, pretty: bool) -> str:
+        writer = QueryWriter(pretty=pretty)
+        self._create_root_node().write(writer)
+        return writer.getvalue()
+
+    def _render_from_template(self, *, pretty: bool) -> str:
+        """Render the query by filling a cached template for this query shape.
+
+        The template is compiled on the first call for a given shape by rendering the
+        node tree with every argument value replaced by a slot, subsequent calls only
+        have to serialize the argument values.
+
+        Pretty queries are only built to be logged so they are always rendered in full.
+        """
+        if QUERY_TEMPLATE_CACHE_SIZE <= 0 or pretty:
+            return self._render(pretty=pretty)
+
+        raw = self.method in RAW_METHODS
+        values: list[Any] = []
+        try:
+            key = (
+                self.method,
+                self.model,
+                tuple(self.root_selection) if self.root_selection is not None else None,
+                _arguments_shape(self.arguments, values, raw=raw),
+                _include_shape(self.include, values),
+            )
+            template = _query_templates.get(key)
+        except _UncacheableQuery:
+            return self._render(pretty=pretty)
+
+        if template is None:
+            template = self._compile_template(raw=raw)
+            if template is None:
+                return self._render(pretty=pretty)
+
+            # least recently used templates are evicted first
+            while len(_query_templates) >= QUERY_TEMPLATE_CACHE_SIZE:
+                try:
+                    _query_templates.popitem(last=False)
+                except KeyError:  # pragma: no cover
+                    break
+            _query_templates[key] = template
+        else:
+            try:
+                _query_templates.move_to_end(key)
+            except KeyError:  # pragma: no cover
+                # evicted by another thread
+                pass
+
+        encode = _encode
+        parts = [template[0]]
+        for value, text in zip(values, template[1:]):
+            if value.__class__ is _ScalarList:
+                parts.append(value.encode(encode))
+            else:
+                parts.append(encode(value))
+            parts.append(text)
+        return ''.join(parts)
+
+    def _compile_template(self, *, raw: bool) -> tuple[str, ...] | None:
+        arguments = self.arguments
+        include = self.include
+        counter = itertools.count()
+        self.arguments = _arguments_with_slots(arguments, counter, raw=raw)
+        self.include = _include_with_slots(include, counter)
+        try:
+            rendered = self._render(pretty=False)
+        finally:
+            self.arguments = arguments
+            self.include = include
+
+        pieces = _SLOT_RE.split(rendered)
+        indexes = [int(index) for index in pieces[1::2]]
+        if indexes != list(range(next(counter))):  # pragma: no cover
+            # every slot must be rendered exactly once and in order
+            return None
+
+        return tuple(pieces[0::2])
+
     def _create_root_node(self) -> 'RootNode':
         root = RootNode(builder=self)
         root.add(ResultNode.create(self))
@@ -325,16 +425,87 @@ def _is_prisma_model_type(type_: type[BaseModel]) -> TypeGuard[type[PrismaModel]
     return issubclass(type_, _PrismaModel)
 
 
+class QueryWriter:
+    """Buffer that a node tree is rendered into in a single pass.
+
+    By default nodes are separated by single characters, if `pretty` is True
+    every node is written on its own line and indented by its depth.
+    """
+
+    pretty: bool
+    parts: list[str]
+    prefix: str
+
+    __slots__ = (
+        'pretty',
+        'parts',
+        'prefix',
+    )
+
+    def __init__(self, *, pretty: bool = False) -> None:
+        self.pretty = pretty
+        self.parts = []
+        self.prefix = ''
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+
+    def join(self, joiner: str, *, between_children: bool) -> None:
+        """Write the separator between two parts of a node.
+
+        Compact output only needs a separator between sibling children, the
+        parts written when entering & departing a node are delimiters already.
+        """
+        if self.pretty:
+            if joiner.endswith('\n'):
+                self.parts.append(joiner + self.prefix)
+            else:
+                self.parts.append(joiner)
+        elif between_children:
+            self.parts.append(COMPACT_JOINERS.get(joiner) or joiner.strip() or ' ')
+
+    def indent(self, indent: str) -> str:
+        """Indent subsequent lines, returns the previous prefix to pass to `dedent()`"""
+        prefix = self.prefix
+        if indent and self.pretty:
+            self.prefix = prefix + indent
+        return prefix
+
+    def dedent(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def getvalue(self) -> str:
+        return ''.join(self.parts)
+
+
+COMPACT_JOINERS: dict[str, str] = {
+    '\n': ' ',
+    ',\n': ',',
+}
+
+
 class AbstractNode(ABC):
     __slots__ = ()
 
     @abstractmethod
+    def write(self, writer: QueryWriter) -> None:
+        """Write the node to the given writer
+
+        This is only called if `should_render()` returns True.
+        """
+        ...
+
     def render(self) -> str | None:
-        """Render the node to a string
+        """Render the node to an indented string
 
         None is returned if the node should not be rendered.
         """
-        ...
+        if not self.should_render():
+            return None
+
+        writer = QueryWriter(pretty=True)
+        self.write(writer)
+        return writer.getvalue()
 
     def should_render(self) -> bool:
         """If True, rendering of the node is skipped
@@ -383,40 +554,49 @@ class Node(AbstractNode):
         return None
 
     @override
-    def render(self) -> str | None:
-        """Render the node and it's children and to string.
+    def write(self, writer: QueryWriter) -> None:
+        """Write the node and it's children.
 
-        Rendering a node involves 4 steps:
+        Rendering a node involves 3 steps, each separated by the joiner:
 
         1. Entering the node
-        2. Rendering it's children
+        2. Writing it's children, indented by one level
         3. Departing the node
-        4. Joining the previous steps together into a single string
         """
-        if not self.should_render():
-            return None
+        joiner = self.joiner
+        written = False
 
-        strings: list[str] = []
         entered = self.enter()
         if entered is not None:
-            strings.append(entered)
+            writer.write(entered)
+            written = True
 
+        children_written = False
+        outer = writer.indent(self.indent)
         for child in self.children:
-            content: str | None = None
+            if isinstance(child, str):
+                if not child:
+                    continue
+            elif not child.should_render():
+                continue
+
+            if written:
+                writer.join(joiner, between_children=children_written)
 
             if isinstance(child, str):
-                content = child
+                writer.write(child)
             else:
-                content = child.render()
+                child.write(writer)
 
-            if content:
-                strings.append(indent(content, self.indent))
+            written = children_written = True
+
+        writer.dedent(outer)
 
         departed = self.depart()
         if departed is not None:
-            strings.append(departed)
-
-        return self.joiner.join(strings)
+            if written:
+                writer.join(joiner, between_children=False)
+            writer.write(departed)
 
     def add(self, child: ChildType) -> None:
         """Add a child"""
@@ -571,7 +751,7 @@ class Arguments(Node):
                 # here as prisma expects parameters to be passed as a json string
                 # value like "[\"John\",\"123\"]", and we encode twice to ensure
                 # that only the inner quotes are escaped
-                if self.builder.method in {'query_raw', 'query_first', 'execute_raw'}:
+                if self.builder.method in RAW_METHODS:
                     children.append(f'{arg}: {dumps(dumps(value))}')
                 else:
                     children.append(Key(arg, node=ListNode.create(self.builder, data=value)))
@@ -808,11 +988,11 @@ class Key(AbstractNode):
         self.sep = sep
 
     @override
-    def render(self) -> str:
-        content = self.node.render()
-        if content:
-            return f'{self.key}{self.sep}{content}'
-        return f'{self.key}{self.sep}'
+    def write(self, writer: QueryWriter) -> None:
+        writer.write(self.key)
+        writer.write(self.sep)
+        if self.node.should_render():
+            self.node.write(writer)
 
 
 @singledispatch
@@ -868,11 +1048,186 @@ def serialize_decimal(obj: decimal.Decimal) -> str:
     return str(obj)
 
 
+_encode = make_encoder(serializer)
+
+
 def dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize an object to JSON using the fastest available backend, see `_json`"""
+    if not kwargs:
+        return _encode(obj)
+
     kwargs.setdefault('default', serializer)
     kwargs.setdefault('ensure_ascii', False)
     return json.dumps(obj, **kwargs)
 
 
+# Query templates
+#
+# A query template is the rendered GraphQL query split on its argument values, e.g.
+# ('query {\n  result: findUniqueUser\n  (\n    where: {\n      id: ', '\n    }\n  )...').
+# Templates are keyed on everything that changes the layout of the query: the method,
+# the model, the root selection and the nested key structure of the arguments & include,
+# leaf values are serialized separately into the slots between the pieces. Lists without
+# any objects, e.g. `{'in': [1, 2, 3]}`, fill a single slot so their length is not part
+# of the key.
+
+_query_templates: OrderedDict[Hashable, tuple[str, ...]] = OrderedDict()
+
+_SLOT_RE = re.compile(r'"__prisma_slot_(\d+)__"')
+
+_LEAF = 0
+
+
+class _UncacheableQuery(Exception):
+    """Raised when the query shape cannot be determined, the query is rendered without a template"""
+
+
+class _Slot:
+    """Stands in for an argument value while a template is being rendered"""
+
+    __slots__ = ('index',)
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+
+class _ScalarList:
+    """A list that is rendered as a whole into one slot, it must not contain any objects"""
+
+    __slots__ = ('items',)
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+    def encode(self, encode: Callable[[Any], str]) -> str:
+        # the same output as `ListNode` in compact mode
+        return '[' + ','.join([encode(item) for item in self.items]) + ']'
+
+
+class _RawParameters:
+    """Raw query parameters, prisma expects these to be encoded twice, see `Arguments`"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+@serializer.register(_Slot)
+def _serialize_slot(slot: _Slot) -> str:
+    return f'__prisma_slot_{slot.index}__'
+
+
+@serializer.register(_RawParameters)
+def _serialize_raw_parameters(obj: _RawParameters) -> str:
+    return dumps(obj.value)
+
+
+def clear_query_templates() -> None:
+    """Remove all compiled query templates"""
+    _query_templates.clear()
+
+
+def _value_shape(value: Any, values: list[Any]) -> Hashable:
+    if value is None:
+        return None
+
+    if isinstance(value, dict):
+        return ('{', tuple([(key, _value_shape(item, values)) for key, item in value.items()]))
+
+    if isinstance(value, ITERABLES):
+        if _is_scalar_list(value):
+            values.append(_ScalarList(value))
+            return _LEAF
+        return ('[', tuple([_value_shape(item, values) for item in value]))
+
+    values.append(value)
+    return _LEAF
+
+
+def _is_scalar_list(value: Iterable[Any]) -> bool:
+    for item in value:
+        if isinstance(item, dict):
+            return False
+    return True
+
+
+def _arguments_shape(arguments: Mapping[str, Any], values: list[Any], *, raw: bool) -> Hashable:
+    shape: list[Hashable] = []
+    for key, value in arguments.items():
+        if raw and isinstance(value, ITERABLES):
+            values.append(_RawParameters(value))
+            shape.append((key, _LEAF))
+        else:
+            shape.append((key, _value_shape(value, values)))
+    return tuple(shape)
+
+
+def _include_shape(include: Mapping[str, Any] | None, values: list[Any]) -> Hashable:
+    if include is None:
+        return None
+
+    shape: list[Hashable] = []
+    for key, value in include.items():
+        if value is True or value is False:
+            shape.append((key, value))
+        elif isinstance(value, dict):
+            # the include arguments are rendered before the nested include
+            arguments = {k: v for k, v in value.items() if k != 'include'}
+            shape.append(
+                (
+                    key,
+                    _arguments_shape(arguments, values, raw=False),
+                    _include_shape(value.get('include'), values),
+                )
+            )
+        else:
+            raise _UncacheableQuery()
+    return tuple(shape)
+
+
+def _value_with_slots(value: Any, counter: Iterator[int]) -> Any:
+    if value is None:
+        return None
+
+    if isinstance(value, dict):
+        return {key: _value_with_slots(item, counter) for key, item in value.items()}
+
+    if isinstance(value, ITERABLES):
+        if _is_scalar_list(value):
+            return _Slot(next(counter))
+        return [_value_with_slots(item, counter) for item in value]
+
+    return _Slot(next(counter))
+
+
+def _arguments_with_slots(arguments: Mapping[str, Any], counter: Iterator[int], *, raw: bool) -> dict[str, Any]:
+    return {
+        key: _Slot(next(counter))
+        if raw and isinstance(value, ITERABLES)
+        else _value_with_slots(value, counter)
+        for key, value in arguments.items()
+    }
+
+
+def _include_with_slots(include: Mapping[str, Any] | None, counter: Iterator[int]) -> dict[str, Any] | None:
+    if include is None:
+        return None
+
+    transformed: dict[str, Any] = {}
+    for key, value in include.items():
+        if isinstance(value, dict):
+            arguments = _arguments_with_slots(
+                {k: v for k, v in value.items() if k != 'include'}, counter, raw=False
+            )
+            nested = value.get('include')
+            if nested is not None:
+                arguments['include'] = _include_with_slots(nested, counter)
+            transformed[key] = arguments
+        else:
+            transformed[key] = value
+    return transformed
+
+
 # black does not respect the fmt: off comment without this
 # fmt: on
@@ -295,6 +295,13 @@ def model_parse(model: type[_ModelT], obj: Any) -> _ModelT:
         return model.parse_obj(obj)  # pyright: ignore[reportDeprecated]
 
 
+def model_construct(model: type[_ModelT], values: dict[str, Any]) -> _ModelT:
+    if PYDANTIC_V2:
+        return model.model_construct(**values)
+    else:
+        return model.construct(**values)  # pyright: ignore[reportDeprecated]
+
+
 def model_parse_json(model: type[_ModelT], obj: str) -> _ModelT:
     if PYDANTIC_V2:
         return model.model_validate_json(obj)
@@ -0,0 +1,342 @@
+"""Trusted hydration of query engine results into models.
+
+`model_parse()` fully validates every row that the query engine returns. As the
+engine only ever returns data in the shape of the schema, clients created with
+`Prisma(trusted_hydration=True)` skip validation and construct the models
+directly, converting only the fields that pydantic would otherwise coerce.
+
+The converters for every model are generated in `models.py` and registered here,
+they are compiled once for each concrete model class so that partial types and
+subclasses resolve their own relational field types.
+"""
+
+from __future__ import annotations
+
+import sys
+import decimal
+import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Union, Mapping, TypeVar, Callable, Iterable
+
+from . import fields
+from ._json import loads
+from ._compat import PYDANTIC_V2, model_parse, model_fields, model_construct
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+__all__ = (
+    'Relation',
+    'register',
+    'hydrate',
+    'hydrate_many',
+    'to_datetime',
+    'to_float',
+    'to_int',
+    'to_decimal',
+    'to_json',
+    'to_base64',
+    'each',
+)
+
+_ModelT = TypeVar('_ModelT', bound='BaseModel')
+
+Converter = Callable[[Any], Any]
+Hydrator = Callable[[Dict[str, Any]], Any]
+
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, bytes, tuple, frozenset, decimal.Decimal)
+
+
+class Relation:
+    """Marks a relational field, the related model is resolved for each concrete model class"""
+
+    is_list: bool
+
+    __slots__ = ('is_list',)
+
+    def __init__(self, *, is_list: bool) -> None:
+        self.is_list = is_list
+
+
+_converters: Dict[str, Mapping[str, Union[Converter, Relation]]] = {}
+_hydrators: Dict[type, Hydrator] = {}
+
+
+def register(model: str, converters: Mapping[str, Union[Converter, Relation]]) -> None:
+    """Register the generated field converters for the given Prisma model name"""
+    _converters[model] = converters
+    _hydrators.clear()
+
+
+def hydrate(model: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """Construct a model from trusted query engine data without validating it"""
+    hydrator = _hydrators.get(model)
+    if hydrator is None:
+        hydrator = _compile(model)
+    return hydrator(data)  # type: ignore[no-any-return]
+
+
+def hydrate_many(model: Type[_ModelT], data: Iterable[Dict[str, Any]]) -> List[_ModelT]:
+    hydrator = _hydrators.get(model)
+    if hydrator is None:
+        hydrator = _compile(model)
+    return [hydrator(row) for row in data]
+
+
+def _compile(model: type[BaseModel]) -> Hydrator:
+    hydrator = _create_hydrator(model)
+    _hydrators[model] = hydrator
+    return hydrator
+
+
+def _create_hydrator(model: type[BaseModel]) -> Hydrator:
+    table = _converters.get(getattr(model, '__prisma_model__', ''))
+    if table is None:
+        return _validator(model)
+
+    info = model_fields(model)
+    converters: list[tuple[str, Union[Converter, _Related]]] = []
+    for name, converter in table.items():
+        field = info.get(name)
+        if field is None:
+            # excluded from this partial type
+            continue
+
+        if isinstance(converter, Relation):
+            from ._builder import _prisma_model_for_field
+
+            related = _prisma_model_for_field(field, name=name, parent=model)
+            if related is None:
+                # the field type has been overridden, we can't know how to construct it
+                return _validator(model)
+
+            converters.append((name, _Related(related, is_list=converter.is_list)))
+        else:
+            converters.append((name, converter))
+
+    if PYDANTIC_V2 and _can_construct(model):
+        return _constructor(model, converters)
+
+    converters = [
+        (name, _relation(converter.model, is_list=converter.is_list) if isinstance(converter, _Related) else converter)
+        for name, converter in converters
+    ]
+
+    def construct(data: Dict[str, Any]) -> Any:
+        values = dict(data)
+        for name, converter in converters:
+            value = values.get(name)
+            if value is not None:
+                values[name] = converter(value)
+        return model_construct(model, values)
+
+    return construct
+
+
+class _Related:
+    model: type[BaseModel]
+    is_list: bool
+
+    __slots__ = ('model', 'is_list')
+
+    def __init__(self, model: type[BaseModel], *, is_list: bool) -> None:
+        self.model = model
+        self.is_list = is_list
+
+
+def _constructor(model: type[BaseModel], converters: list[tuple[str, Union[Converter, _Related]]]) -> Hydrator:
+    """Compile a function equivalent to `model.model_construct(**data)` for the given model.
+
+    The default values & field order are precomputed and the converters are unrolled, e.g.
+
+    def construct(data):
+        values = {**template, **data}
+        if len(values) != size:
+            return construct_known(data)
+        values['createdAt'] = convert_0(values['createdAt'])
+        value = values['readAt']
+        if value is not None:
+            values['readAt'] = convert_1(value)
+        instance = new(model)
+        ...
+    """
+    info = model_fields(model)
+    template: dict[str, Any] = {name: None if field.is_required() else field.default for name, field in info.items()}
+    namespace: dict[str, Any] = {
+        'model': model,
+        'template': template,
+        'size': len(template),
+        'new': model.__new__,
+        'setattr_': object.__setattr__,
+    }
+    lines = [
+        'def construct(data):',
+        '    values = {**template, **data}',
+        '    if len(values) != size:',
+        '        return construct_known(data)',
+    ]
+    for index, (name, converter) in enumerate(converters):
+        if isinstance(converter, _Related):
+            # relational fields are always optional
+            key = f'hydrate_{index}'
+            namespace[key] = _deferred(namespace, key, converter.model)
+            if converter.is_list:
+                expression = f'[{key}(item) for item in value]'
+            else:
+                expression = f'{key}(value)'
+
+            lines.extend(
+                [
+                    f'    value = values[{name!r}]',
+                    '    if value is not None:',
+                    f'        values[{name!r}] = {expression}',
+                ]
+            )
+            continue
+
+        namespace[f'convert_{index}'] = converter
+        if info[name].is_required():
+            lines.append(f'    values[{name!r}] = convert_{index}(values[{name!r}])')
+        else:
+            lines.extend(
+                [
+                    f'    value = values[{name!r}]',
+                    '    if value is not None:',
+                    f'        values[{name!r}] = convert_{index}(value)',
+                ]
+            )
+    lines.extend(
+        [
+            '    instance = new(model)',
+            "    setattr_(instance, '__dict__', values)",
+            "    setattr_(instance, '__pydantic_fields_set__', set(data))",
+            "    setattr_(instance, '__pydantic_extra__', None)",
+            "    setattr_(instance, '__pydantic_private__', None)",
+            '    return instance',
+        ]
+    )
+    exec('\n'.join(lines), namespace)  # noqa: S102
+    construct: Hydrator = namespace['construct']
+
+    def construct_known(data: Dict[str, Any]) -> Any:
+        # unknown keys are ignored, the same as `model_construct()`
+        return construct({name: value for name, value in data.items() if name in template})
+
+    namespace['construct_known'] = construct_known
+    return construct
+
+
+def _can_construct(model: type[BaseModel]) -> bool:
+    """Whether or not instances of the model can be created by `_constructor()`"""
+    if model.model_config.get('extra') == 'allow':
+        return False
+
+    if getattr(model, '__pydantic_root_model__', False) or getattr(model, '__pydantic_post_init__', None):
+        return False
+
+    if getattr(model, '__private_attributes__', None):
+        return False
+
+    for name, field in model_fields(model).items():
+        if field.alias is not None and field.alias != name:
+            return False
+
+        if field.default_factory is not None:
+            return False
+
+        if not field.is_required() and not isinstance(field.default, _IMMUTABLE_DEFAULTS):
+            return False
+
+    return True
+
+
+def _deferred(namespace: dict[str, Any], key: str, model: type[BaseModel]) -> Hydrator:
+    """Stands in for the hydrator of a related model until it is first needed.
+
+    Relations can be cyclic so the related hydrator can't be compiled up front, once
+    it has been compiled it replaces this function in the namespace of the constructor.
+    """
+
+    def hydrate_deferred(data: Dict[str, Any]) -> Any:
+        hydrator = _hydrators.get(model) or _compile(model)
+        namespace[key] = hydrator
+        return hydrator(data)
+
+    return hydrate_deferred
+
+
+def _validator(model: type[BaseModel]) -> Hydrator:
+    def validate(data: Dict[str, Any]) -> Any:
+        return model_parse(model, data)
+
+    return validate
+
+
+def _relation(model: type[BaseModel], *, is_list: bool) -> Converter:
+    if is_list:
+
+        def convert_many(value: Any) -> Any:
+            return hydrate_many(model, value)
+
+        return convert_many
+
+    def convert(value: Any) -> Any:
+        return hydrate(model, value)
+
+    return convert
+
+
+# field converters, referenced by the generated models
+
+
+if sys.version_info >= (3, 11):
+    # parses the `Z` suffix & any number of fractional digits
+    to_datetime: Converter = datetime.datetime.fromisoformat
+else:
+
+    def to_datetime(value: Any) -> Any:
+        if isinstance(value, str):
+            if value.endswith('Z'):
+                value = value[:-1] + '+00:00'
+            return datetime.datetime.fromisoformat(value)
+        return value
+
+
+def to_float(value: Any) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def to_int(value: Any) -> Any:
+    if isinstance(value, str):
+        return int(value)
+    return value
+
+
+def to_decimal(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal):
+        return value
+    return decimal.Decimal(str(value))
+
+
+def to_json(value: Any) -> Any:
+    if isinstance(value, (str, bytes)):
+        return loads(value)
+    return value
+
+
+def to_base64(value: Any) -> Any:
+    if isinstance(value, str):
+        return fields.Base64(value.encode('ascii'))
+    if isinstance(value, bytes):
+        return fields.Base64(value)
+    return value
+
+
+def each(converter: Converter) -> Converter:
+    """Apply a converter to every item of a scalar list field"""
+
+    def convert(value: Any) -> Any:
+        return [converter(item) if item is not None else None for item in value]
+
+    return convert
@@ -0,0 +1,84 @@
+"""JSON encoding & decoding of query engine payloads.
+
+orjson or msgspec are used when they are installed, falling back to the standard
+library. The backend can be forced with the `PRISMA_PY_JSON` environment variable,
+one of `auto` (the default), `orjson`, `msgspec` or `json`.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+from typing import Any, Callable
+
+__all__ = (
+    'BACKEND',
+    'loads',
+    'make_encoder',
+)
+
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+Encoder = Callable[[Any], str]
+
+
+def _select_backend() -> str:
+    requested = os.environ.get('PRISMA_PY_JSON', 'auto').lower()
+    if requested not in {'auto', *BACKENDS}:
+        raise ValueError(f'Invalid PRISMA_PY_JSON value: {requested!r}, expected auto or one of {BACKENDS}')
+
+    candidates = BACKENDS if requested == 'auto' else (requested,)
+    for name in candidates:
+        if name == 'json':
+            return name
+        try:
+            __import__(name)
+        except ImportError:
+            if requested != 'auto':
+                raise
+            continue
+        return name
+
+    return 'json'  # pragma: no cover
+
+
+BACKEND: str = _select_backend()
+"""The name of the library that is used to decode & encode JSON"""
+
+
+if BACKEND == 'orjson':
+    import orjson
+
+    loads: Callable[[str | bytes], Any] = orjson.loads
+elif BACKEND == 'msgspec':
+    import msgspec
+
+    loads = msgspec.json.decode
+else:
+    loads = json.loads
+
+
+def make_encoder(default: Callable[[Any], Any]) -> Encoder:
+    """Returns a function that encodes an object to a JSON string.
+
+    `default` is called for objects that the backend does not support, datetimes are always
+    passed to it so that they can be normalised the way the query engine expects.
+    """
+    fallback = json.JSONEncoder(ensure_ascii=False, default=default).encode
+    if BACKEND != 'orjson':
+        # msgspec always encodes datetime & Decimal natively, skipping `default`, so it
+        # is only used for decoding
+        return fallback
+
+    dumps = orjson.dumps
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+
+    def encode(obj: Any) -> str:
+        try:
+            return dumps(obj, default=default, option=option).decode('utf-8')
+        except TypeError:
+            # orjson doesn't support integers larger than 64 bits or non-string dict keys,
+            # the standard library re-raises the error if the object is actually invalid
+            return fallback(obj)
+
+    return encode
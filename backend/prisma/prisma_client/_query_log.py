@@ -0,0 +1,252 @@
+"""Logging of the queries sent to & the responses received from the query engine.
+
+There are three levels, configured with the `PRISMA_PY_QUERY_LOG` environment
+variable or `configure_query_logging()`:
+
+- `off`: nothing is logged
+- `shape`: the engine operation, status, payload size & duration, no argument values or rows
+- `full`: the generated query and the request & response bodies, truncated
+
+Every message is formatted lazily so nothing is rendered unless the logger is
+enabled for DEBUG, the request is sampled and a handler actually emits the record.
+
+A request is sampled once, when its query is built, and the resulting trace is
+passed on to the engine so the query, request & response are logged together.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+import random
+import logging
+import reprlib
+from typing import Any
+from typing_extensions import Literal
+
+__all__ = (
+    'QueryLogLevel',
+    'QueryTrace',
+    'configure_query_logging',
+    'start_trace',
+)
+
+log: logging.Logger = logging.getLogger(__name__)
+
+QueryLogLevel = Literal['off', 'shape', 'full']
+
+LEVELS: tuple[QueryLogLevel, ...] = ('off', 'shape', 'full')
+
+_OPERATION_RE = re.compile(r'result: (\w+)')
+
+
+# Invalid environment values are ignored with a warning instead of failing the import
+
+
+def _env_level() -> QueryLogLevel:
+    value = os.environ.get('PRISMA_PY_QUERY_LOG', 'full').lower()
+    for level in LEVELS:
+        if value == level:
+            return level
+    log.warning('Ignoring invalid PRISMA_PY_QUERY_LOG value: %r, expected one of %s', value, LEVELS)
+    return 'full'
+
+
+def _env_sample_rate() -> float:
+    value = os.environ.get('PRISMA_PY_QUERY_LOG_SAMPLE', '1')
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = -1.0
+    if not 0 <= rate <= 1:
+        log.warning('Ignoring invalid PRISMA_PY_QUERY_LOG_SAMPLE value: %r, expected a number between 0 and 1', value)
+        return 1.0
+    return rate
+
+
+def _env_max_chars() -> int:
+    value = os.environ.get('PRISMA_PY_QUERY_LOG_MAX_CHARS', '2000')
+    try:
+        return int(value)
+    except ValueError:
+        log.warning('Ignoring invalid PRISMA_PY_QUERY_LOG_MAX_CHARS value: %r, expected an integer', value)
+        return 2000
+
+
+class _QueryLogConfig:
+    level: QueryLogLevel
+    sample_rate: float
+    max_chars: int
+    repr: reprlib.Repr
+
+    __slots__ = (
+        'level',
+        'sample_rate',
+        'max_chars',
+        'repr',
+    )
+
+    def __init__(self) -> None:
+        self.level = _env_level()
+        self.sample_rate = _env_sample_rate()
+        self.max_chars = _env_max_chars()
+
+        # only the first few rows / keys of a response are ever converted to a string
+        self.repr = reprlib.Repr()
+        self.repr.maxlevel = 6
+        self.repr.maxdict = 20
+        self.repr.maxlist = 10
+        self.repr.maxstring = 200
+        self.repr.maxother = 200
+
+
+_config = _QueryLogConfig()
+
+
+def configure_query_logging(
+    *,
+    level: QueryLogLevel | None = None,
+    sample_rate: float | None = None,
+    max_chars: int | None = None,
+) -> None:
+    """Override the query logging options set by the environment.
+
+    `sample_rate` is the fraction of requests that are logged, between 0 and 1.
+    `max_chars` is the maximum length of a logged query or body.
+    """
+    if level is not None:
+        if level not in LEVELS:
+            raise ValueError(f'Invalid query log level: {level!r}, expected one of {LEVELS}')
+        _config.level = level
+
+    if sample_rate is not None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be between 0 and 1')
+        _config.sample_rate = sample_rate
+
+    if max_chars is not None:
+        _config.max_chars = max_chars
+
+
+def start_trace(logger: logging.Logger) -> QueryTrace | None:
+    """Returns a trace if this request should be logged, None otherwise"""
+    config = _config
+    if config.level == 'off' or not logger.isEnabledFor(logging.DEBUG):
+        return None
+
+    rate = config.sample_rate
+    if rate < 1 and random.random() >= rate:
+        return None
+
+    return QueryTrace(full=config.level == 'full')
+
+
+class QueryTrace:
+    """Logs a single request, created by `start_trace()`
+
+    Each message is logged to the logger of the module that emits it.
+    """
+
+    full: bool
+    start: float
+
+    __slots__ = (
+        'full',
+        'start',
+    )
+
+    def __init__(self, *, full: bool) -> None:
+        self.full = full
+        self.start = time.perf_counter()
+
+    def query(self, logger: logging.Logger, query: str) -> None:
+        if self.full:
+            logger.debug('Generated query: \n%s', _Truncated(query))
+
+    def request(self, logger: logging.Logger, method: str, url: str, headers: dict[str, str], content: Any) -> None:
+        # the response duration excludes the time spent building the query
+        self.start = time.perf_counter()
+        if self.full:
+            logger.debug('Constructed %s request to %s', method, url)
+            logger.debug('Request headers: %s', headers)
+            logger.debug('Request content: %s', _Truncated(content))
+        else:
+            logger.debug('%s %s %s (%s)', method, url, _Operation(content), _Size(content))
+
+    def response(self, logger: logging.Logger, method: str, url: str, status: int, data: Any) -> None:
+        elapsed = _Elapsed(self.start)
+        if self.full:
+            logger.debug('%s %s returned %s in %s: %s', method, url, status, elapsed, _Truncated(data))
+        else:
+            logger.debug('%s %s returned %s in %s (%s)', method, url, status, elapsed, _Size(data))
+
+
+class _Truncated:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        value = self.value
+        max_chars = _config.max_chars
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('utf-8', errors='replace')
+        text = value if isinstance(value, str) else _config.repr.repr(value)
+        if len(text) > max_chars:
+            return f'{text[:max_chars]}... ({len(text) - max_chars} more characters)'
+        return text
+
+
+class _Operation:
+    __slots__ = ('content',)
+
+    def __init__(self, content: Any) -> None:
+        self.content = content
+
+    def __str__(self) -> str:
+        content = self.content
+        if isinstance(content, (bytes, bytearray)):
+            content = content[:512].decode('utf-8', errors='replace')
+        if isinstance(content, str):
+            match = _OPERATION_RE.search(content, 0, 512)
+            if match is not None:
+                return match.group(1)
+        return '-'
+
+
+class _Size:
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        value = self.value
+        if value is None:
+            return 'no content'
+        if isinstance(value, str):
+            return f'{len(value)} characters'
+        if isinstance(value, (bytes, bytearray)):
+            return f'{len(value)} bytes'
+        if isinstance(value, dict):
+            data = value.get('data')
+            result = data.get('result') if isinstance(data, dict) else None
+            if isinstance(result, list):
+                return f'{len(result)} rows'
+            if 'errors' in value:
+                return 'errors'
+            return '1 row'
+        return type(value).__name__
+
+
+class _Elapsed:
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start: float) -> None:
+        self.start = start
+        self.end = time.perf_counter()
+
+    def __str__(self) -> str:
+        return f'{(self.end - self.start) * 1000:.1f}ms'
@@ -43,7 +43,6 @@ from typing import TypeVar
 import warnings
 
 from . import types, errors, bases
-from ._compat import model_parse
 
 if TYPE_CHECKING:
     from .client import Prisma
@@ -188,7 +187,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -307,7 +306,7 @@ class UserActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -358,7 +357,7 @@ class UserActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -406,7 +405,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -477,7 +476,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -545,7 +544,7 @@ class UserActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -609,7 +608,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -666,7 +665,7 @@ class UserActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -728,7 +727,7 @@ class UserActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -1214,7 +1213,7 @@ class VenueActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -1329,7 +1328,7 @@ class VenueActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -1380,7 +1379,7 @@ class VenueActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -1428,7 +1427,7 @@ class VenueActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -1499,7 +1498,7 @@ class VenueActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -1567,7 +1566,7 @@ class VenueActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -1631,7 +1630,7 @@ class VenueActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -1688,7 +1687,7 @@ class VenueActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -1746,7 +1745,7 @@ class VenueActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -2233,7 +2232,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -2350,7 +2349,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -2401,7 +2400,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -2449,7 +2448,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -2520,7 +2519,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -2588,7 +2587,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -2652,7 +2651,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -2709,7 +2708,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -2769,7 +2768,7 @@ class EventSourceActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -3256,7 +3255,7 @@ class TagActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -3373,7 +3372,7 @@ class TagActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -3424,7 +3423,7 @@ class TagActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -3472,7 +3471,7 @@ class TagActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -3543,7 +3542,7 @@ class TagActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -3611,7 +3610,7 @@ class TagActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -3675,7 +3674,7 @@ class TagActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -3732,7 +3731,7 @@ class TagActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -3792,7 +3791,7 @@ class TagActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -4280,7 +4279,7 @@ class EventActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -4399,7 +4398,7 @@ class EventActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -4450,7 +4449,7 @@ class EventActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -4498,7 +4497,7 @@ class EventActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -4569,7 +4568,7 @@ class EventActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -4637,7 +4636,7 @@ class EventActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -4701,7 +4700,7 @@ class EventActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -4758,7 +4757,7 @@ class EventActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -4820,7 +4819,7 @@ class EventActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -5308,7 +5307,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -5427,7 +5426,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -5478,7 +5477,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -5526,7 +5525,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -5597,7 +5596,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -5665,7 +5664,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -5729,7 +5728,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -5786,7 +5785,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -5848,7 +5847,7 @@ class SavedEventActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
@@ -6337,7 +6336,7 @@ class NotificationActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def create_many(
         self,
@@ -6458,7 +6457,7 @@ class NotificationActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_unique(
         self,
@@ -6509,7 +6508,7 @@ class NotificationActions(Generic[_PrismaModelT]):
         result = resp['data']['result']
         if result is None:
             return None
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_unique_or_raise(
         self,
@@ -6557,7 +6556,7 @@ class NotificationActions(Generic[_PrismaModelT]):
                 'include': include,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def find_many(
         self,
@@ -6628,7 +6627,7 @@ class NotificationActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return [model_parse(self._model, r) for r in resp['data']['result']]
+        return self._client._parse_models(self._model, resp['data']['result'])
 
     async def find_first(
         self,
@@ -6696,7 +6695,7 @@ class NotificationActions(Generic[_PrismaModelT]):
         if result is None:
             return None
 
-        return model_parse(self._model, result)
+        return self._client._parse_model(self._model, result)
 
     async def find_first_or_raise(
         self,
@@ -6760,7 +6759,7 @@ class NotificationActions(Generic[_PrismaModelT]):
                 'distinct': distinct,
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update(
         self,
@@ -6817,7 +6816,7 @@ class NotificationActions(Generic[_PrismaModelT]):
         except errors.RecordNotFoundError:
             return None
 
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def upsert(
         self,
@@ -6881,7 +6880,7 @@ class NotificationActions(Generic[_PrismaModelT]):
                 'update': data.get('update'),
             },
         )
-        return model_parse(self._model, resp['data']['result'])
+        return self._client._parse_model(self._model, resp['data']['result'])
 
     async def update_many(
         self,
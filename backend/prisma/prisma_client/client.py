@@ -54,6 +54,7 @@ from .types import DatasourceOverride, HttpConfig, MetricsFormat
 from ._types import BaseModelT, PrismaMethod, TransactionId, Datasource
 from .bases import _PrismaModel
 from ._builder import QueryBuilder, dumps
+from ._query_log import start_trace
 from .generator.models import EngineType, OptionalValueFromEnvVar, BinaryPaths
 from ._compat import removeprefix, model_parse
 from ._constants import DEFAULT_CONNECT_TIMEOUT, DEFAULT_TX_MAX_WAIT, DEFAULT_TX_TIMEOUT
@@ -121,6 +122,7 @@ class Prisma(AsyncBasePrisma):
         datasource: DatasourceOverride | None = None,
         connect_timeout: int | timedelta = DEFAULT_CONNECT_TIMEOUT,
         http: HttpConfig | None = None,
+        trusted_hydration: bool = False,
     ) -> None:
         super().__init__(
             http=http,
@@ -128,6 +130,7 @@ class Prisma(AsyncBasePrisma):
             log_queries=log_queries,
             datasource=datasource,
             connect_timeout=connect_timeout,
+            trusted_hydration=trusted_hydration,
         )
         self._set_generated_properties(
             schema_path=SCHEMA_PATH,
@@ -321,6 +324,7 @@ class Batch:
             prisma_models=PRISMA_MODELS,
             relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
         )
+        # logging is decided once for the whole batch in `commit()`
         self.__queries.append(builder.build_query())
 
     async def commit(self) -> None:
@@ -329,6 +333,11 @@ class Batch:
         queries = self.__queries
         self.__queries = []
 
+        trace = start_trace(log)
+        if trace is not None:
+            for query in queries:
+                trace.query(log, query)
+
         payload = {
             'batch': [
                 {
@@ -342,6 +351,7 @@ class Batch:
         await self.__client._engine.query(
             dumps(payload),
             tx_id=self.__client._tx_id,
+            trace=trace,
         )
 
     def execute_raw(self, query: LiteralString, *args: Any) -> None:
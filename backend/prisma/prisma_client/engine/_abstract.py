@@ -11,6 +11,7 @@ from .._constants import DEFAULT_CONNECT_TIMEOUT
 
 if TYPE_CHECKING:
     from ..types import MetricsFormat, DatasourceOverride  # noqa: TID251
+    from .._query_log import QueryTrace
 
 
 __all__ = (
@@ -57,7 +58,7 @@ class SyncAbstractEngine(BaseAbstractEngine):
         ...
 
     @abstractmethod
-    def query(self, content: str, *, tx_id: TransactionId | None) -> Any:
+    def query(self, content: str, *, tx_id: TransactionId | None, trace: QueryTrace | None = None) -> Any:
         """Execute a GraphQL query.
 
         This method expects a JSON object matching this structure:
@@ -67,6 +68,9 @@ class SyncAbstractEngine(BaseAbstractEngine):
             'operation_name': str,
             'query': str,
         }
+
+        `trace` is the query logging decision made when the query was built,
+        see `QueryBuilder.build()`, the request is not logged without one.
         """
         ...
 
@@ -126,7 +130,7 @@ class AsyncAbstractEngine(BaseAbstractEngine):
         ...
 
     @abstractmethod
-    async def query(self, content: str, *, tx_id: TransactionId | None) -> Any:
+    async def query(self, content: str, *, tx_id: TransactionId | None, trace: QueryTrace | None = None) -> Any:
         """Execute a GraphQL query.
 
         This method expects a JSON object matching this structure:
@@ -136,6 +140,9 @@ class AsyncAbstractEngine(BaseAbstractEngine):
             'operation_name': str,
             'query': str,
         }
+
+        `trace` is the query logging decision made when the query was built,
+        see `QueryBuilder.build()`, the request is not logged without one.
         """
         ...
 
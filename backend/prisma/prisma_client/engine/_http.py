@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, NoReturn
 from datetime import timedelta
@@ -10,7 +9,9 @@ import httpx
 
 from . import utils, errors
 from ..utils import is_dict
+from .._json import loads
 from .._types import Method
+from .._query_log import QueryTrace, start_trace
 from ._abstract import SyncAbstractEngine, AsyncAbstractEngine
 from .._sync_http import SyncHTTP
 from .._async_http import AsyncHTTP
@@ -62,12 +63,7 @@ class BaseHTTPEngine:
         if content is not None:
             kwargs['content'] = content
 
-        url = self.url + path
-        log.debug('Constructed %s request to %s', method, url)
-        log.debug('Request headers: %s', kwargs['headers'])
-        log.debug('Request content: %s', content)
-
-        return url, kwargs
+        return self.url + path, kwargs
 
     def _process_response_data(
         self,
@@ -77,7 +73,7 @@ class BaseHTTPEngine:
     ) -> Any:
         if isinstance(data, str):
             # workaround for https://github.com/prisma/prisma-engines/pull/4246
-            data = json.loads(data)
+            data = loads(data)
 
         if not is_dict(data):
             raise TypeError(f'Expected deserialised engine response to be a dictionary, got {type(data)} - {data}')
@@ -138,6 +134,25 @@ class SyncHTTPEngine(BaseHTTPEngine, SyncAbstractEngine):
         content: Any = None,
         headers: dict[str, str] | None = None,
         parse_response: bool = True,
+    ) -> Any:
+        return self._request(
+            method,
+            path,
+            content=content,
+            headers=headers,
+            parse_response=parse_response,
+            trace=start_trace(log),
+        )
+
+    def _request(
+        self,
+        method: Method,
+        path: str,
+        *,
+        content: Any,
+        headers: dict[str, str] | None,
+        parse_response: bool,
+        trace: QueryTrace | None,
     ) -> Any:
         url, kwargs = self._build_request(
             path=path,
@@ -146,9 +161,10 @@ class SyncHTTPEngine(BaseHTTPEngine, SyncAbstractEngine):
             headers=headers,
             parse_response=parse_response,
         )
+        if trace is not None:
+            trace.request(log, method, url, kwargs['headers'], content)
 
         response = self.session.request(method, url, **kwargs)
-        log.debug('%s %s returned status %s', method, url, response.status)
 
         if 300 > response.status >= 200:
             # In certain cases we just want to return the response content as-is.
@@ -157,15 +173,20 @@ class SyncHTTPEngine(BaseHTTPEngine, SyncAbstractEngine):
             # which is incompatible with JSON.
             if not parse_response:
                 text = response.text()
-                log.debug('%s %s returned text: %s', method, url, text)
+                if trace is not None:
+                    trace.response(log, method, url, response.status, text)
                 return text
 
             data = response.json()
-            log.debug('%s %s returned %s', method, url, data)
+            if trace is not None:
+                trace.response(log, method, url, response.status, data)
 
             return self._process_response_data(data=data, response=response)
 
-        self._process_response_error(body=response.text(), response=response)
+        body = response.text()
+        if trace is not None:
+            trace.response(log, method, url, response.status, body)
+        self._process_response_error(body=body, response=response)
 
 
 class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
@@ -205,6 +226,25 @@ class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
         content: Any = None,
         headers: dict[str, str] | None = None,
         parse_response: bool = True,
+    ) -> Any:
+        return await self._request(
+            method,
+            path,
+            content=content,
+            headers=headers,
+            parse_response=parse_response,
+            trace=start_trace(log),
+        )
+
+    async def _request(
+        self,
+        method: Method,
+        path: str,
+        *,
+        content: Any,
+        headers: dict[str, str] | None,
+        parse_response: bool,
+        trace: QueryTrace | None,
     ) -> Any:
         url, kwargs = self._build_request(
             path=path,
@@ -213,9 +253,10 @@ class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
             headers=headers,
             parse_response=parse_response,
         )
+        if trace is not None:
+            trace.request(log, method, url, kwargs['headers'], content)
 
         response = await self.session.request(method, url, **kwargs)
-        log.debug('%s %s returned status %s', method, url, response.status)
 
         if 300 > response.status >= 200:
             # In certain cases we just want to return the response content as-is.
@@ -224,12 +265,17 @@ class AsyncHTTPEngine(BaseHTTPEngine, AsyncAbstractEngine):
             # which is incompatible with JSON.
             if not parse_response:
                 text = await response.text()
-                log.debug('%s %s returned text: %s', method, url, text)
+                if trace is not None:
+                    trace.response(log, method, url, response.status, text)
                 return text
 
             data = await response.json()
-            log.debug('%s %s returned %s', method, url, data)
+            if trace is not None:
+                trace.response(log, method, url, response.status, data)
 
             return self._process_response_data(data=data, response=response)
 
-        self._process_response_error(body=await response.text(), response=response)
+        body = await response.text()
+        if trace is not None:
+            trace.response(log, method, url, response.status, body)
+        self._process_response_error(body=body, response=response)
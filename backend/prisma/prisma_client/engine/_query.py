@@ -24,6 +24,7 @@ from .._constants import DEFAULT_CONNECT_TIMEOUT
 
 if TYPE_CHECKING:
     from ..types import MetricsFormat, DatasourceOverride  # noqa: TID251
+    from .._query_log import QueryTrace
 
 
 __all__ = (
@@ -234,16 +235,19 @@ class SyncQueryEngine(BaseQueryEngine, SyncHTTPEngine):
         content: str,
         *,
         tx_id: TransactionId | None,
+        trace: QueryTrace | None = None,
     ) -> Any:
         headers: dict[str, str] = {}
         if tx_id is not None:
             headers['X-transaction-id'] = tx_id
 
-        return self.request(
+        return self._request(
             'POST',
             '/',
             content=content,
             headers=headers,
+            parse_response=True,
+            trace=trace,
         )
 
     @override
@@ -396,16 +400,19 @@ class AsyncQueryEngine(BaseQueryEngine, AsyncHTTPEngine):
         content: str,
         *,
         tx_id: TransactionId | None,
+        trace: QueryTrace | None = None,
     ) -> Any:
         headers: dict[str, str] = {}
         if tx_id is not None:
             headers['X-transaction-id'] = tx_id
 
-        return await self.request(
+        return await self._request(
             'POST',
             '/',
             content=content,
             headers=headers,
+            parse_response=True,
+            trace=trace,
         )
 
     @override
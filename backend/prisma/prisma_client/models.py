@@ -46,7 +46,7 @@ from collections import OrderedDict
 
 from pydantic import BaseModel, Field
 
-from . import types, enums, errors, fields, bases
+from . import types, enums, errors, fields, bases, _hydration
 from ._types import FuncType
 from ._compat import model_rebuild, field_validator
 from ._builder import serialize_base64
@@ -201,6 +201,7 @@ class Venue(bases.BaseVenue):
     country: Optional[_str] = None
     lat: Optional[_float] = None
     lng: Optional[_float] = None
+    key: Optional[_str] = None
     createdAt: datetime.datetime
     events: Optional[List['models.Event']] = None
 
@@ -1070,6 +1071,12 @@ _User_fields: Dict['types.UserKeys', PartialModelField] = OrderedDict(
     ],
 )
 
+_User_converters: Dict[str, Any] = {
+    'createdAt': _hydration.to_datetime,
+    'savedEvents': _hydration.Relation(is_list=True),
+    'notifications': _hydration.Relation(is_list=True),
+}
+
 _Venue_relational_fields: Set[str] = {
         'events',
     }
@@ -1139,6 +1146,14 @@ _Venue_fields: Dict['types.VenueKeys', PartialModelField] = OrderedDict(
             'is_relational': False,
             'documentation': None,
         }),
+        ('key', {
+            'name': 'key',
+            'is_list': False,
+            'optional': True,
+            'type': '_str',
+            'is_relational': False,
+            'documentation': None,
+        }),
         ('createdAt', {
             'name': 'createdAt',
             'is_list': False,
@@ -1158,6 +1173,13 @@ _Venue_fields: Dict['types.VenueKeys', PartialModelField] = OrderedDict(
     ],
 )
 
+_Venue_converters: Dict[str, Any] = {
+    'lat': _hydration.to_float,
+    'lng': _hydration.to_float,
+    'createdAt': _hydration.to_datetime,
+    'events': _hydration.Relation(is_list=True),
+}
+
 _EventSource_relational_fields: Set[str] = {
         'events',
     }
@@ -1206,6 +1228,11 @@ _EventSource_fields: Dict['types.EventSourceKeys', PartialModelField] = OrderedD
     ],
 )
 
+_EventSource_converters: Dict[str, Any] = {
+    'createdAt': _hydration.to_datetime,
+    'events': _hydration.Relation(is_list=True),
+}
+
 _Tag_relational_fields: Set[str] = {
         'events',
     }
@@ -1238,6 +1265,10 @@ _Tag_fields: Dict['types.TagKeys', PartialModelField] = OrderedDict(
     ],
 )
 
+_Tag_converters: Dict[str, Any] = {
+    'events': _hydration.Relation(is_list=True),
+}
+
 _Event_relational_fields: Set[str] = {
         'venue',
         'source',
@@ -1402,6 +1433,18 @@ _Event_fields: Dict['types.EventKeys', PartialModelField] = OrderedDict(
     ],
 )
 
+_Event_converters: Dict[str, Any] = {
+    'startTime': _hydration.to_datetime,
+    'endTime': _hydration.to_datetime,
+    'venue': _hydration.Relation(is_list=False),
+    'source': _hydration.Relation(is_list=False),
+    'createdAt': _hydration.to_datetime,
+    'updatedAt': _hydration.to_datetime,
+    'tags': _hydration.Relation(is_list=True),
+    'savedBy': _hydration.Relation(is_list=True),
+    'notifications': _hydration.Relation(is_list=True),
+}
+
 _SavedEvent_relational_fields: Set[str] = {
         'user',
         'event',
@@ -1459,6 +1502,12 @@ _SavedEvent_fields: Dict['types.SavedEventKeys', PartialModelField] = OrderedDic
     ],
 )
 
+_SavedEvent_converters: Dict[str, Any] = {
+    'createdAt': _hydration.to_datetime,
+    'user': _hydration.Relation(is_list=False),
+    'event': _hydration.Relation(is_list=False),
+}
+
 _Notification_relational_fields: Set[str] = {
         'user',
         'event',
@@ -1540,6 +1589,13 @@ _Notification_fields: Dict['types.NotificationKeys', PartialModelField] = Ordere
     ],
 )
 
+_Notification_converters: Dict[str, Any] = {
+    'user': _hydration.Relation(is_list=False),
+    'event': _hydration.Relation(is_list=False),
+    'createdAt': _hydration.to_datetime,
+    'readAt': _hydration.to_datetime,
+}
+
 
 
 # we have to import ourselves as relation types are namespaced to models
@@ -1554,3 +1610,12 @@ model_rebuild(Tag)
 model_rebuild(Event)
 model_rebuild(SavedEvent)
 model_rebuild(Notification)
+
+# field converters used by clients created with `trusted_hydration=True`
+_hydration.register('User', _User_converters)
+_hydration.register('Venue', _Venue_converters)
+_hydration.register('EventSource', _EventSource_converters)
+_hydration.register('Tag', _Tag_converters)
+_hydration.register('Event', _Event_converters)
+_hydration.register('SavedEvent', _SavedEvent_converters)
+_hydration.register('Notification', _Notification_converters)
@@ -2418,6 +2418,7 @@ class VenueOptionalCreateInput(TypedDict, total=False):
     country: Optional[_str]
     lat: Optional[_float]
     lng: Optional[_float]
+    key: Optional[_str]
     createdAt: datetime.datetime
     events: 'EventCreateManyNestedWithoutRelationsInput'
 
@@ -2439,6 +2440,7 @@ class VenueOptionalCreateWithoutRelationsInput(TypedDict, total=False):
     country: Optional[_str]
     lat: Optional[_float]
     lng: Optional[_float]
+    key: Optional[_str]
     createdAt: datetime.datetime
 
 
@@ -2464,7 +2466,18 @@ _VenueWhereUnique_id_Input = TypedDict(
     total=True
 )
 
-VenueWhereUniqueInput = _VenueWhereUnique_id_Input
+_VenueWhereUnique_key_Input = TypedDict(
+    '_VenueWhereUnique_key_Input',
+    {
+        'key': '_str',
+    },
+    total=True
+)
+
+VenueWhereUniqueInput = Union[
+    '_VenueWhereUnique_id_Input',
+    '_VenueWhereUnique_key_Input',
+]
 
 
 class VenueUpdateInput(TypedDict, total=False):
@@ -2477,6 +2490,7 @@ class VenueUpdateInput(TypedDict, total=False):
     country: Optional[_str]
     lat: Optional[Union[AtomicFloatInput, _float]]
     lng: Optional[Union[AtomicFloatInput, _float]]
+    key: Optional[_str]
     createdAt: datetime.datetime
     events: 'EventUpdateManyWithoutRelationsInput'
 
@@ -2491,6 +2505,7 @@ class VenueUpdateManyMutationInput(TypedDict, total=False):
     country: Optional[_str]
     lat: Optional[Union[AtomicFloatInput, _float]]
     lng: Optional[Union[AtomicFloatInput, _float]]
+    key: Optional[_str]
     createdAt: datetime.datetime
 
 
@@ -2590,6 +2605,14 @@ _Venue_lng_OrderByInput = TypedDict(
     total=True
 )
 
+_Venue_key_OrderByInput = TypedDict(
+    '_Venue_key_OrderByInput',
+    {
+        'key': 'SortOrder',
+    },
+    total=True
+)
+
 _Venue_createdAt_OrderByInput = TypedDict(
     '_Venue_createdAt_OrderByInput',
     {
@@ -2607,6 +2630,7 @@ VenueOrderByInput = Union[
     '_Venue_country_OrderByInput',
     '_Venue_lat_OrderByInput',
     '_Venue_lng_OrderByInput',
+    '_Venue_key_OrderByInput',
     '_Venue_createdAt_OrderByInput',
 ]
 
@@ -3422,6 +3446,7 @@ class VenueWhereInput(TypedDict, total=False):
     country: Union[None, _str, 'types.StringFilter']
     lat: Union[None, _float, 'types.FloatFilter']
     lng: Union[None, _float, 'types.FloatFilter']
+    key: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     events: 'EventListRelationFilter'
 
@@ -3442,6 +3467,7 @@ class VenueWhereInputRecursive1(TypedDict, total=False):
     country: Union[None, _str, 'types.StringFilter']
     lat: Union[None, _float, 'types.FloatFilter']
     lng: Union[None, _float, 'types.FloatFilter']
+    key: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     events: 'EventListRelationFilter'
 
@@ -3462,6 +3488,7 @@ class VenueWhereInputRecursive2(TypedDict, total=False):
     country: Union[None, _str, 'types.StringFilter']
     lat: Union[None, _float, 'types.FloatFilter']
     lng: Union[None, _float, 'types.FloatFilter']
+    key: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     events: 'EventListRelationFilter'
 
@@ -3482,6 +3509,7 @@ class VenueWhereInputRecursive3(TypedDict, total=False):
     country: Union[None, _str, 'types.StringFilter']
     lat: Union[None, _float, 'types.FloatFilter']
     lng: Union[None, _float, 'types.FloatFilter']
+    key: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     events: 'EventListRelationFilter'
 
@@ -3502,6 +3530,7 @@ class VenueWhereInputRecursive4(TypedDict, total=False):
     country: Union[None, _str, 'types.StringFilter']
     lat: Union[None, _float, 'types.FloatFilter']
     lng: Union[None, _float, 'types.FloatFilter']
+    key: Union[None, _str, 'types.StringFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeFilter']
     events: 'EventListRelationFilter'
 
@@ -3522,6 +3551,7 @@ class VenueScalarWhereWithAggregatesInput(TypedDict, total=False):
     country: Union[_str, 'types.StringWithAggregatesFilter']
     lat: Union[_float, 'types.FloatWithAggregatesFilter']
     lng: Union[_float, 'types.FloatWithAggregatesFilter']
+    key: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
     AND: List['VenueScalarWhereWithAggregatesInputRecursive1']
@@ -3539,6 +3569,7 @@ class VenueScalarWhereWithAggregatesInputRecursive1(TypedDict, total=False):
     country: Union[_str, 'types.StringWithAggregatesFilter']
     lat: Union[_float, 'types.FloatWithAggregatesFilter']
     lng: Union[_float, 'types.FloatWithAggregatesFilter']
+    key: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
     AND: List['VenueScalarWhereWithAggregatesInputRecursive2']
@@ -3556,6 +3587,7 @@ class VenueScalarWhereWithAggregatesInputRecursive2(TypedDict, total=False):
     country: Union[_str, 'types.StringWithAggregatesFilter']
     lat: Union[_float, 'types.FloatWithAggregatesFilter']
     lng: Union[_float, 'types.FloatWithAggregatesFilter']
+    key: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
     AND: List['VenueScalarWhereWithAggregatesInputRecursive3']
@@ -3573,6 +3605,7 @@ class VenueScalarWhereWithAggregatesInputRecursive3(TypedDict, total=False):
     country: Union[_str, 'types.StringWithAggregatesFilter']
     lat: Union[_float, 'types.FloatWithAggregatesFilter']
     lng: Union[_float, 'types.FloatWithAggregatesFilter']
+    key: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
     AND: List['VenueScalarWhereWithAggregatesInputRecursive4']
@@ -3590,6 +3623,7 @@ class VenueScalarWhereWithAggregatesInputRecursive4(TypedDict, total=False):
     country: Union[_str, 'types.StringWithAggregatesFilter']
     lat: Union[_float, 'types.FloatWithAggregatesFilter']
     lng: Union[_float, 'types.FloatWithAggregatesFilter']
+    key: Union[_str, 'types.StringWithAggregatesFilter']
     createdAt: Union[datetime.datetime, 'types.DateTimeWithAggregatesFilter']
 
 
@@ -3603,6 +3637,7 @@ class VenueGroupByOutput(TypedDict, total=False):
     country: _str
     lat: _float
     lng: _float
+    key: _str
     createdAt: datetime.datetime
     _sum: 'VenueSumAggregateOutput'
     _avg: 'VenueAvgAggregateOutput'
@@ -3635,6 +3670,7 @@ class VenueScalarAggregateOutput(TypedDict, total=False):
     country: _str
     lat: _float
     lng: _float
+    key: _str
     createdAt: datetime.datetime
 
 
@@ -3652,6 +3688,7 @@ class VenueMaxAggregateInput(TypedDict, total=False):
     country: bool
     lat: bool
     lng: bool
+    key: bool
     createdAt: bool
 
 
@@ -3665,6 +3702,7 @@ class VenueMinAggregateInput(TypedDict, total=False):
     country: bool
     lat: bool
     lng: bool
+    key: bool
     createdAt: bool
 
 
@@ -3690,6 +3728,7 @@ VenueCountAggregateInput = TypedDict(
         'country': bool,
         'lat': bool,
         'lng': bool,
+        'key': bool,
         'createdAt': bool,
         '_all': bool,
     },
@@ -3707,6 +3746,7 @@ VenueCountAggregateOutput = TypedDict(
         'country': int,
         'lat': int,
         'lng': int,
+        'key': int,
         'createdAt': int,
         '_all': int,
     },
@@ -3723,6 +3763,7 @@ VenueKeys = Literal[
     'country',
     'lat',
     'lng',
+    'key',
     'createdAt',
     'events',
 ]
@@ -3735,6 +3776,7 @@ VenueScalarFieldKeys = Literal[
     'country',
     'lat',
     'lng',
+    'key',
     'createdAt',
 ]
 VenueScalarFieldKeysT = TypeVar('VenueScalarFieldKeysT', bound=VenueScalarFieldKeys)
@@ -8857,7 +8899,28 @@ _NotificationWhereUnique_id_Input = TypedDict(
     total=True
 )
 
-NotificationWhereUniqueInput = _NotificationWhereUnique_id_Input
+_NotificationCompounduserId_eventId_typeKeyInner = TypedDict(
+    '_NotificationCompounduserId_eventId_typeKeyInner',
+    {
+        'userId': '_int',
+        'eventId': '_int',
+        'type': 'enums.NotificationType',
+    },
+    total=True
+)
+
+_NotificationCompounduserId_eventId_typeKey = TypedDict(
+    '_NotificationCompounduserId_eventId_typeKey',
+    {
+        'userId_eventId_type': '_NotificationCompounduserId_eventId_typeKeyInner',
+    },
+    total=True
+)
+
+NotificationWhereUniqueInput = Union[
+    '_NotificationWhereUnique_id_Input',
+    '_NotificationCompounduserId_eventId_typeKey',
+]
 
 
 class NotificationUpdateInput(TypedDict, total=False):
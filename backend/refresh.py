@@ -0,0 +1,173 @@
+import asyncio, os, logging, tempfile, time
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from typing import IO, Deque, Dict, List, Optional
+from prisma.prisma_client import Prisma
+
+from events_router import upsert_scraped_rows
+from scraping import scrape_many
+
+log = logging.getLogger("eventhub.refresh")
+
+REFRESH_ENABLED = os.getenv("REFRESH_ENABLED", "0") == "1"
+REFRESH_INTERVAL = float(os.getenv("REFRESH_INTERVAL_SECONDS", "60"))
+REFRESH_STALE_AFTER = timedelta(hours=float(os.getenv("REFRESH_STALE_HOURS", "24")))
+REFRESH_BATCH_SIZE = int(os.getenv("REFRESH_BATCH_SIZE", "20"))
+# At most REFRESH_PER_DOMAIN refreshes of one domain per rolling window,
+# counted across passes
+REFRESH_PER_DOMAIN = int(os.getenv("REFRESH_PER_DOMAIN", "5"))
+REFRESH_DOMAIN_WINDOW = float(os.getenv("REFRESH_DOMAIN_WINDOW_SECONDS", str(REFRESH_INTERVAL)))
+REFRESH_CONCURRENCY = int(os.getenv("REFRESH_CONCURRENCY", "4"))
+# How many stale rows to rank per pass before picking the batch
+REFRESH_WINDOW = REFRESH_BATCH_SIZE * 10
+# Only the worker holding this file lock runs the loop; empty disables the lock
+REFRESH_LOCK_FILE = os.getenv(
+    "REFRESH_LOCK_FILE", os.path.join(tempfile.gettempdir(), "eventhub-refresh.lock")
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# domain -> monotonic times of its refreshes within the last window
+_domain_refreshes: Dict[str, Deque[float]] = {}
+
+
+def _domain_budget(domain: str, now: float) -> int:
+    history = _domain_refreshes.get(domain)
+    if history is None:
+        return REFRESH_PER_DOMAIN
+    while history and history[0] <= now - REFRESH_DOMAIN_WINDOW:
+        history.popleft()
+    if not history:
+        del _domain_refreshes[domain]
+        return REFRESH_PER_DOMAIN
+    return REFRESH_PER_DOMAIN - len(history)
+
+
+async def _pick_batch(db: Prisma, now: datetime) -> List:
+    candidates = await db.event.find_many(
+        where={
+            "updatedAt": {"lt": now - REFRESH_STALE_AFTER},
+            "OR": [{"startTime": {"gte": now}}, {"startTime": None}],
+        },
+        include={"source": True},
+        order={"updatedAt": "asc"},
+        take=REFRESH_WINDOW,
+    )
+    if not candidates:
+        return []
+
+    saved_counts = {
+        row["eventId"]: row["_count"]["_all"]
+        for row in await db.savedevent.group_by(
+            ["eventId"],
+            where={"eventId": {"in": [ev.id for ev in candidates]}},
+            count=True,
+        )
+    }
+
+    # Most-saved first, then soonest; undated events go last.
+    far_future = now + timedelta(days=36500)
+    candidates.sort(key=lambda ev: (
+        -saved_counts.get(ev.id, 0),
+        ev.startTime or far_future,
+    ))
+
+    batch = []
+    per_domain = Counter()
+    clock = time.monotonic()
+    for ev in candidates:
+        domain = ev.source.domain if ev.source else ""
+        if per_domain[domain] >= _domain_budget(domain, clock):
+            continue
+        per_domain[domain] += 1
+        batch.append(ev)
+        if len(batch) >= REFRESH_BATCH_SIZE:
+            break
+    for domain, count in per_domain.items():
+        _domain_refreshes.setdefault(domain, deque()).extend([clock] * count)
+    return batch
+
+
+async def refresh_stale_events(db: Prisma) -> int:
+    """
+    Re-scrape one bounded batch of stale upcoming events. Returns the number
+    of events picked so the caller can back off when there is nothing to do.
+    """
+    now = datetime.now(timezone.utc)
+    batch = await _pick_batch(db, now)
+    if not batch:
+        return 0
+
+    scraped, failed = [], []
+    ids = {ev.url: ev.id for ev in batch}
+    async for url, data, err in scrape_many(ids, REFRESH_CONCURRENCY):
+        if err is not None or not data:
+            log.info("refresh of %s failed: %s", url, err)
+            failed.append(ids[url])
+        else:
+            scraped.append((url, data))
+
+    if scraped:
+        # A row that fails to write on its own is treated like a failed
+        # scrape, so one bad page can't keep the whole batch stale.
+        for url, err in await upsert_scraped_rows(db, scraped):
+            log.info("refresh of %s failed to save: %s", url, err)
+            failed.append(ids[url])
+    if failed:
+        # Push failures to the back of the queue instead of retrying them
+        # on every pass.
+        await db.event.update_many(
+            where={"id": {"in": failed}},
+            data={"updatedAt": now},
+        )
+    return len(batch)
+
+
+def _try_lock() -> Optional[IO]:
+    """
+    Take the cross-worker refresh lock without blocking. Returns the open
+    lock file, which holds the lock until it is closed, or None if another
+    worker has it.
+    """
+    f = open(REFRESH_LOCK_FILE, "a")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+async def run_refresh_loop(db: Prisma) -> None:
+    """
+    Refresh stale events until cancelled. With several uvicorn workers only
+    the one holding the lock file refreshes; the others retry every
+    REFRESH_INTERVAL so one takes over if the holder exits.
+    """
+    lock = None
+    try:
+        if REFRESH_LOCK_FILE and fcntl is not None:
+            while (lock := _try_lock()) is None:
+                await asyncio.sleep(REFRESH_INTERVAL)
+        await _refresh_forever(db)
+    finally:
+        if lock is not None:
+            lock.close()
+
+
+async def _refresh_forever(db: Prisma) -> None:
+    while True:
+        try:
+            picked = await refresh_stale_events(db)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            log.exception("event refresh pass failed")
+            picked = 0
+        if picked < REFRESH_BATCH_SIZE:
+            await asyncio.sleep(REFRESH_INTERVAL)
+        else:
+            await asyncio.sleep(0)
@@ -1,9 +1,44 @@
-import re, json, datetime, urllib.parse
-from typing import Optional, Dict, Any, List
+import re, json, datetime, urllib.parse, asyncio, os, hashlib, threading, time, random
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Optional, Dict, Any, List, Iterable, AsyncIterator, Tuple
 from bs4 import BeautifulSoup
 from dateutil import parser as dtparse
 import httpx
 
+USER_AGENT = "Mozilla/5.0 EventHubBot"
+SCRAPE_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", "20"))
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "16"))
+SCRAPE_PER_HOST = int(os.getenv("SCRAPE_PER_HOST", "4"))
+SCRAPE_HOST_RPS = float(os.getenv("SCRAPE_HOST_RPS", "2"))
+SCRAPE_HOST_BURST = float(os.getenv("SCRAPE_HOST_BURST", "4"))
+# Idle host limiters beyond this many are evicted, least recently used first
+SCRAPE_MAX_HOSTS = int(os.getenv("SCRAPE_MAX_HOSTS", "1024"))
+SCRAPE_MAX_RETRIES = int(os.getenv("SCRAPE_MAX_RETRIES", "3"))
+SCRAPE_BACKOFF_BASE = float(os.getenv("SCRAPE_BACKOFF_BASE", "1"))
+SCRAPE_BACKOFF_MAX = float(os.getenv("SCRAPE_BACKOFF_MAX", "60"))
+RETRY_STATUSES = {429, 502, 503, 504}
+# "thread", "process" or "inline" (parse on the event loop). Most pages take
+# the regex / head-scan fast path, so a process pool only pays off for
+# soup-heavy workloads; measure with benchmarks/bench_parse_pool.py first.
+PARSE_POOL = os.getenv("SCRAPE_PARSE_POOL", "thread")
+PARSE_WORKERS = int(os.getenv("SCRAPE_PARSE_WORKERS", str(os.cpu_count() or 2)))
+PARSE_QUEUE = int(os.getenv("SCRAPE_PARSE_QUEUE", "64"))
+# Empty SCRAPE_CACHE_DIR disables the on-disk response cache
+CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", ".scrape_cache")
+CACHE_MAX_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_MB", "256")) * 1024 * 1024
+# Bump whenever parse_event's output changes; cached results written by
+# another version are re-parsed from the cached body.
+PARSER_VERSION = 2
+
+_client: Optional[httpx.AsyncClient] = None
+_host_limiters: "OrderedDict[str, HostLimiter]" = OrderedDict()
+_parse_pool: Optional[Executor] = None
+_parse_slots: Optional[asyncio.Semaphore] = None
+
 def _first(obj, *keys):
     for k in keys:
         v = obj.get(k)
@@ -19,11 +54,11 @@ def _parse_when(v: Any) -> Optional[datetime.datetime]:
     except Exception:
         return None
 
-def _extract_jsonld_events(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+def _jsonld_events(blocks: Iterable[str]) -> List[Dict[str, Any]]:
     events = []
-    for tag in soup.find_all("script", type="application/ld+json"):
+    for block in blocks:
         try:
-            data = json.loads(tag.string or "")
+            data = json.loads(block or "")
             blobs = data if isinstance(data, list) else [data]
             for b in blobs:
                 typ = b.get("@type") or b.get("@type".lower())
@@ -37,45 +72,499 @@ def _extract_jsonld_events(soup: BeautifulSoup) -> List[Dict[str, Any]]:
             continue
     return events
 
+def _extract_jsonld_events(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    return _jsonld_events(
+        tag.string for tag in soup.find_all("script", type="application/ld+json")
+    )
+
+_JSONLD_RE = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.I | re.S,
+)
+
+class _HeadScanner(HTMLParser):
+    """
+    Collects <title> and <meta> content from the document head without
+    building a tree. Marks itself done at </head> or <body>.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.title: Optional[str] = None
+        self.done = False
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.done = True
+        elif tag == "meta":
+            a = dict(attrs)
+            key = a.get("property") or a.get("name")
+            content = (a.get("content") or "").strip()
+            if key and content and key not in self.meta:
+                self.meta[key] = content
+        elif tag == "title":
+            self._in_title = True
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title = (self.title or "") + data
+
+def _scan_head(html: str, chunk: int = 8192) -> _HeadScanner:
+    scanner = _HeadScanner()
+    for i in range(0, len(html), chunk):
+        scanner.feed(html[i:i + chunk])
+        if scanner.done:
+            break
+    return scanner
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Shared pooled client used by every scraping caller in the process.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=SCRAPE_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=SCRAPE_CONCURRENCY,
+                max_keepalive_connections=SCRAPE_CONCURRENCY,
+            ),
+        )
+    return _client
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def source_domain(url: str) -> str:
+    """
+    Hostname used both as the rate-limit key and as EventSource.domain.
+    """
+    return urllib.parse.urlparse(url).hostname or ""
+
+class HostLimiter:
+    """
+    Token bucket (SCRAPE_HOST_RPS, bursting to SCRAPE_HOST_BURST) plus a
+    connection cap for a single host. A Retry-After or backoff pauses the
+    whole host, not just the request that saw it.
+    """
+
+    def __init__(self, rate: float, burst: float, max_conns: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = asyncio.Lock()
+        self.conns = asyncio.Semaphore(max_conns)
+        self.active = 0
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    @asynccontextmanager
+    async def connection(self):
+        async with self.conns:
+            self.active += 1
+            try:
+                yield
+            finally:
+                self.active -= 1
+
+    def pause(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def idle(self, now: float) -> bool:
+        """
+        No request in flight or waiting, no pause and a full bucket, so a
+        fresh limiter for the host would behave exactly the same.
+        """
+        return (
+            not self.active
+            and not self.lock.locked()
+            and now >= self.blocked_until
+            and self.tokens + (now - self.updated) * self.rate >= self.burst
+        )
+
+def _host_limiter(url: str) -> HostLimiter:
+    host = source_domain(url)
+    limiter = _host_limiters.get(host)
+    if limiter is not None:
+        _host_limiters.move_to_end(host)
+        return limiter
+
+    limiter = _host_limiters[host] = HostLimiter(
+        SCRAPE_HOST_RPS, SCRAPE_HOST_BURST, SCRAPE_PER_HOST
+    )
+    # Hosts come from user-submitted URLs, so keep the table bounded. Busy
+    # or paused limiters are skipped rather than dropped, so the table only
+    # exceeds the cap while that many hosts are in use at once.
+    excess = len(_host_limiters) - SCRAPE_MAX_HOSTS
+    if excess > 0:
+        now = time.monotonic()
+        stale = []
+        for other, old in _host_limiters.items():
+            if len(stale) == excess or old is limiter:
+                break
+            if old.idle(now):
+                stale.append(other)
+        for other in stale:
+            del _host_limiters[other]
+    return limiter
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+async def polite_get(url: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    GET through the per-host limiter, retrying 429/5xx and transport errors
+    with Retry-After or exponential backoff with jitter.
+    """
+    limiter = _host_limiter(url)
+    for attempt in range(SCRAPE_MAX_RETRIES + 1):
+        await limiter.acquire()
+        try:
+            async with limiter.connection():
+                resp = await get_client().get(url, headers=headers)
+        except httpx.TransportError:
+            if attempt == SCRAPE_MAX_RETRIES:
+                raise
+            resp = None
+        if resp is not None and (
+            resp.status_code not in RETRY_STATUSES or attempt == SCRAPE_MAX_RETRIES
+        ):
+            return resp
+
+        delay = _retry_after(resp) if resp is not None else None
+        if delay is not None and delay > SCRAPE_BACKOFF_MAX:
+            # Honour the host's pause for everyone else but don't hold this
+            # caller hostage to it.
+            limiter.pause(delay)
+            return resp
+        if delay is None:
+            delay = min(SCRAPE_BACKOFF_MAX, SCRAPE_BACKOFF_BASE * 2 ** attempt)
+            delay += random.uniform(0, delay / 2)
+        limiter.pause(delay)
+    raise AssertionError("unreachable")
+
+class ResponseCache:
+    """
+    Size-bounded on-disk LRU of scraped responses keyed by URL. Each entry
+    is a JSON file holding the validators (ETag / Last-Modified), the body
+    and the parsed event tagged with PARSER_VERSION, so a 304 skips both
+    the download and, unless the parser has changed since, the parse.
+    """
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key + ".json")
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        if self._index is None:
+            os.makedirs(self.root, exist_ok=True)
+            entries = []
+            for name in os.listdir(self.root):
+                path = os.path.join(self.root, name)
+                if name.endswith(".json"):
+                    st = os.stat(path)
+                    entries.append((st.st_mtime, name[:-5], st.st_size))
+                elif name.endswith(".pkl"):
+                    # entries written by the old pickle format
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+            self._index = OrderedDict((k, size) for _, k, size in sorted(entries))
+            self._total = sum(self._index.values())
+        return self._index
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        k = self.key(url)
+        with self._lock:
+            index = self._load_index()
+            if k not in index:
+                return None
+            index.move_to_end(k)
+        try:
+            with open(self._path(k), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(self._path(k))
+        except Exception:
+            self._drop(k)
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        if not isinstance(entry.get("body"), str):
+            self._drop(k)
+            return None
+        return entry
+
+    def put(self, url: str, entry: Dict[str, Any]) -> None:
+        k = self.key(url)
+        blob = json.dumps({**entry, "url": url}).encode("utf-8")
+        if len(blob) > self.max_bytes:
+            return
+        tmp = self._path(k) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, self._path(k))
+        with self._lock:
+            index = self._load_index()
+            self._total += len(blob) - index.pop(k, 0)
+            index[k] = len(blob)
+            while self._total > self.max_bytes and index:
+                old, size = index.popitem(last=False)
+                self._total -= size
+                try:
+                    os.remove(self._path(old))
+                except OSError:
+                    pass
+
+    def _drop(self, k: str) -> None:
+        with self._lock:
+            if self._index is not None and k in self._index:
+                self._total -= self._index.pop(k)
+        try:
+            os.remove(self._path(k))
+        except OSError:
+            pass
+
+response_cache: Optional[ResponseCache] = (
+    ResponseCache(CACHE_DIR, CACHE_MAX_BYTES) if CACHE_DIR else None
+)
+
+async def fetch_html(url: str) -> str:
+    resp = await polite_get(url)
+    resp.raise_for_status()
+    return resp.text
+
+def _get_parse_pool() -> Executor:
+    global _parse_pool
+    if _parse_pool is None:
+        if PARSE_POOL == "process":
+            _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        else:
+            _parse_pool = ThreadPoolExecutor(
+                max_workers=PARSE_WORKERS, thread_name_prefix="scrape-parse"
+            )
+    return _parse_pool
+
+def shutdown_parse_pool() -> None:
+    global _parse_pool, _parse_slots
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+    _parse_slots = None
+
+async def parse_event_async(html: str, url: str) -> Dict[str, Any]:
+    """
+    Run parse_event on the worker pool. At most PARSE_WORKERS + PARSE_QUEUE
+    pages are submitted at once; further callers wait here, so a burst of
+    scrapes applies backpressure instead of buffering every page in memory.
+    """
+    global _parse_slots
+    if PARSE_POOL == "inline":
+        return parse_event(html, url)
+    if _parse_slots is None:
+        _parse_slots = asyncio.Semaphore(PARSE_WORKERS + PARSE_QUEUE)
+    async with _parse_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_parse_pool(), parse_event, html, url)
+
 async def scrape_event(url: str) -> Dict[str, Any]:
-    async with httpx.AsyncClient(follow_redirects=True, timeout=20) as client:
-        resp = await client.get(url, headers={"User-Agent":"Mozilla/5.0 EventHubBot"})
-        resp.raise_for_status()
-        html = resp.text
+    if response_cache is None:
+        html = await fetch_html(url)
+        return await parse_event_async(html, url)
 
-    soup = BeautifulSoup(html, "lxml")
+    entry = await asyncio.to_thread(response_cache.get, url)
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
 
-    jsonld_events = _extract_jsonld_events(soup)
+    resp = await polite_get(url, headers=headers)
+
+    if resp.status_code == 304 and entry:
+        if entry.get("parser") == PARSER_VERSION and isinstance(entry.get("parsed"), dict):
+            return _load_parsed(entry["parsed"])
+        data = await parse_event_async(entry["body"], url)
+        await asyncio.to_thread(response_cache.put, url, {
+            **entry, "parsed": _dump_parsed(data), "parser": PARSER_VERSION,
+        })
+        return data
+
+    resp.raise_for_status()
+    html = resp.text
+    data = await parse_event_async(html, url)
+
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        await asyncio.to_thread(response_cache.put, url, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": html,
+            "parsed": _dump_parsed(data),
+            "parser": PARSER_VERSION,
+        })
+    return data
+
+_PARSED_DATETIMES = ("startTime", "endTime")
+
+def _dump_parsed(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **data,
+        **{k: data[k].isoformat() for k in _PARSED_DATETIMES if data.get(k) is not None},
+    }
+
+def _load_parsed(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **data,
+        **{k: datetime.datetime.fromisoformat(data[k]) for k in _PARSED_DATETIMES if data.get(k)},
+    }
+
+async def scrape_many(
+    urls: Iterable[str],
+    concurrency: int = SCRAPE_CONCURRENCY,
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Scrape many URLs with at most `concurrency` requests in flight, yielding
+    (url, data, error) as each one finishes.
+    """
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(url: str):
+        async with gate:
+            try:
+                return url, await scrape_event(url), None
+            except Exception as e:
+                return url, None, e
+
+    tasks = [asyncio.create_task(one(u)) for u in urls]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
+        # Wait for cancelled scrapes so none outlive the caller and race
+        # close_client() on shutdown.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+def _tag_name(value: str) -> str:
+    # "https://schema.org/OfflineEventAttendanceMode" -> "OfflineEventAttendanceMode"
+    return value.rstrip("/").rsplit("/", 1)[-1]
+
+def _event_from_jsonld(e: Dict[str, Any], url: str) -> Dict[str, Any]:
+    offers = e.get("offers") or {}
+    loc = e.get("location") or {}
+    if isinstance(loc, list): loc = loc[0] or {}
+    addr = loc.get("address") or {}
+    if isinstance(addr, list): addr = addr[0] or {}
+
+    return {
+        "title": _first(e, "name"),
+        "description": _first(e, "description"),
+        "imageUrl": _first(e, "image"),
+        "startTime": _parse_when(_first(e, "startDate", "startTime")),
+        "endTime": _parse_when(_first(e, "endDate", "endTime")),
+        "timezone": None,
+        "price": _first(offers, "price", "priceCurrency", "url"),
+        "isFree": str(offers.get("price", "")).strip() in ("0", "", "0.0"),
+        "venue": {
+            "name": _first(loc, "name"),
+            "street": _first(addr, "streetAddress"),
+            "city": _first(addr, "addressLocality"),
+            "state": _first(addr, "addressRegion"),
+            "country": _first(addr, "addressCountry"),
+            "lat": float(loc.get("geo", {}).get("latitude")) if loc.get("geo") else None,
+            "lng": float(loc.get("geo", {}).get("longitude")) if loc.get("geo") else None,
+        },
+        "tags": [
+            _tag_name(t) for t in (e.get("eventAttendanceMode"), e.get("eventStatus"))
+            if isinstance(t, str) and t
+        ],
+        "source": source_domain(url),
+    }
+
+def parse_event(html: str, url: str) -> Dict[str, Any]:
+    # Fast path: pull JSON-LD blocks straight out of the raw markup and
+    # OpenGraph event tags out of <head>; only build the full soup when
+    # neither yields an event.
+    jsonld_events = _jsonld_events(_JSONLD_RE.findall(html))
     if jsonld_events:
-        e = jsonld_events[0]
-        offers = e.get("offers") or {}
-        loc = e.get("location") or {}
-        if isinstance(loc, list): loc = loc[0] or {}
-        addr = loc.get("address") or {}
-        if isinstance(addr, list): addr = addr[0] or {}
+        return _event_from_jsonld(jsonld_events[0], url)
 
+    head = _scan_head(html)
+    start = _parse_when(head.meta.get("event:start_time"))
+    title = head.meta.get("og:title") or (head.title.strip() if head.title else None)
+    if start and title:
         return {
-            "title": _first(e, "name"),
-            "description": _first(e, "description"),
-            "imageUrl": _first(e, "image"),
-            "startTime": _parse_when(_first(e, "startDate", "startTime")),
-            "endTime": _parse_when(_first(e, "endDate", "endTime")),
+            "title": title,
+            "description": head.meta.get("og:description") or head.meta.get("description"),
+            "imageUrl": head.meta.get("og:image"),
+            "startTime": start,
+            "endTime": _parse_when(head.meta.get("event:end_time")),
             "timezone": None,
-            "price": _first(offers, "price", "priceCurrency", "url"),
-            "isFree": str(offers.get("price", "")).strip() in ("0", "", "0.0"),
-            "venue": {
-                "name": _first(loc, "name"),
-                "street": _first(addr, "streetAddress"),
-                "city": _first(addr, "addressLocality"),
-                "state": _first(addr, "addressRegion"),
-                "country": _first(addr, "addressCountry"),
-                "lat": float(loc.get("geo", {}).get("latitude")) if loc.get("geo") else None,
-                "lng": float(loc.get("geo", {}).get("longitude")) if loc.get("geo") else None,
-            },
-            "tags": [t for t in (e.get("eventAttendanceMode"), e.get("eventStatus")) if t],
-            "source": urllib.parse.urlparse(url).hostname or "",
+            "price": None,
+            "isFree": None,
+            "venue": {"name": None},
+            "tags": [],
+            "source": source_domain(url),
         }
 
+    soup = BeautifulSoup(html, "lxml")
+
+    jsonld_events = _extract_jsonld_events(soup)
+    if jsonld_events:
+        return _event_from_jsonld(jsonld_events[0], url)
+
     def get_meta(p):
         el = soup.find("meta", property=p) or soup.find("meta", attrs={"name": p})
         return el["content"].strip() if el and el.get("content") else None
@@ -106,5 +595,5 @@ async def scrape_event(url: str) -> Dict[str, Any]:
         "isFree": None,
         "venue": {"name": venue_name},
         "tags": [],
-        "source": urllib.parse.urlparse(url).hostname or "",
+        "source": source_domain(url),
     }
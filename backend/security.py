@@ -1,13 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from jose import jwt
+from jose import jwt, JWTError
 from passlib.context import CryptContext
-import os
+from typing import Optional
+import asyncio, base64, hashlib, hmac, json, os, threading, time
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# The first scheme hashes new passwords; hashes in any later scheme, or
+# made with different cost settings, are upgraded on the next login.
+PASSWORD_SCHEMES = [
+    x.strip() for x in os.getenv("PASSWORD_SCHEMES", "bcrypt").split(",") if x.strip()
+]
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_KIB = int(os.getenv("ARGON2_MEMORY_KIB", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "4"))
+
+def build_pwd_context(
+    schemes=PASSWORD_SCHEMES,
+    bcrypt_rounds: int = BCRYPT_ROUNDS,
+    argon2_time_cost: int = ARGON2_TIME_COST,
+    argon2_memory_kib: int = ARGON2_MEMORY_KIB,
+    argon2_parallelism: int = ARGON2_PARALLELISM,
+) -> CryptContext:
+    settings = {}
+    if "bcrypt" in schemes:
+        settings["bcrypt__rounds"] = bcrypt_rounds
+    if "argon2" in schemes:
+        settings.update({
+            "argon2__type": "ID",
+            "argon2__time_cost": argon2_time_cost,
+            "argon2__memory_cost": argon2_memory_kib,
+            "argon2__parallelism": argon2_parallelism,
+        })
+    return CryptContext(schemes=list(schemes), deprecated="auto", **settings)
+
+pwd_context = build_pwd_context()
 
 JWT_SECRET = os.getenv("JWT_SECRET", "supersecret")
 JWT_ALG = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_MIN = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "120"))
+# Stream tickets only open GET /notifications/stream, so they can sit in a
+# URL (and so in access logs) without exposing the access token.
+STREAM_TICKET_SECONDS = int(os.getenv("STREAM_TICKET_SECONDS", "60"))
+
+# bcrypt and argon2 release the GIL, so a thread pool spreads hashing
+# across cores.
+HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+HASH_QUEUE_LIMIT = int(os.getenv("HASH_QUEUE_LIMIT", "32"))
+
+_hash_pool = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="pwd-hash")
+_hash_inflight = 0
+_hash_inflight_lock = threading.Lock()
+
+class HashPoolSaturated(Exception):
+    """
+    Raised instead of queueing when HASH_WORKERS + HASH_QUEUE_LIMIT
+    hashes are already pending.
+    """
+
+class HashStats:
+    def __init__(self):
+        self.count = 0
+        self.rejected = 0
+        self.hash_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.max_hash_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, wait: float, run: float) -> None:
+        self.count += 1
+        self.wait_seconds += wait
+        self.hash_seconds += run
+        self.max_wait_seconds = max(self.max_wait_seconds, wait)
+        self.max_hash_seconds = max(self.max_hash_seconds, run)
+
+    def snapshot(self) -> dict:
+        n = self.count or 1
+        return {
+            "count": self.count,
+            "rejected": self.rejected,
+            "inflight": _hash_inflight,
+            "avg_hash_ms": self.hash_seconds / n * 1000,
+            "avg_wait_ms": self.wait_seconds / n * 1000,
+            "max_hash_ms": self.max_hash_seconds * 1000,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+hash_stats = HashStats()
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -15,15 +94,135 @@ def hash_password(password: str) -> str:
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
-def create_access_token(sub: str):
+def verify_and_update_password(plain: str, hashed: str):
+    """
+    Returns (valid, new_hash). new_hash is set when the stored hash uses a
+    deprecated scheme or outdated cost settings and should be replaced.
+    """
+    return pwd_context.verify_and_update(plain, hashed)
+
+def _release_hash_slot(_future) -> None:
+    global _hash_inflight
+    with _hash_inflight_lock:
+        _hash_inflight -= 1
+
+async def _run_hash(fn, *args):
+    global _hash_inflight
+    if _hash_inflight >= HASH_WORKERS + HASH_QUEUE_LIMIT:
+        hash_stats.rejected += 1
+        raise HashPoolSaturated()
+
+    submitted = time.perf_counter()
+    started = None
+
+    def timed():
+        nonlocal started
+        started = time.perf_counter()
+        return fn(*args)
+
+    with _hash_inflight_lock:
+        _hash_inflight += 1
+    future = _hash_pool.submit(timed)
+    # Released when the pool is done with the hash, not when the caller
+    # stops waiting: a cancelled request leaves its hash running.
+    future.add_done_callback(_release_hash_slot)
+    result = await asyncio.wrap_future(future)
+    finished = time.perf_counter()
+    hash_stats.record(started - submitted, finished - started)
+    return result
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash(hash_password, password)
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await _run_hash(verify_password, plain, hashed)
+
+async def verify_and_update_password_async(plain: str, hashed: str):
+    return await _run_hash(verify_and_update_password, plain, hashed)
+
+def create_access_token(sub: str, uid: Optional[int] = None):
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_MIN)
     payload = {"sub": sub, "exp": expire}
+    if uid is not None:
+        # Lets security_deps resolve the caller's id without a user lookup
+        payload["uid"] = uid
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALG)
 
+def _b64decode(seg: str) -> bytes:
+    return base64.urlsafe_b64decode(seg + "=" * (-len(seg) % 4))
+
+# What create_access_token issues. Anything else is left to python-jose.
+_FAST_HEADER = {"alg": "HS256", "typ": "JWT"}
+_FAST_CLAIMS = {"sub", "exp", "uid"}
+
+def decode_hs256(token: str) -> dict:
+    """
+    Lean HS256 verifier for the tokens create_access_token issues: checks
+    the HMAC signature, exp and the claim types, nothing else. Tokens with
+    any other header or claims go through jwt.decode. Raises JWTError on
+    any failure, like jwt.decode.
+    """
+    try:
+        header_seg, payload_seg, sig_seg = token.split(".")
+        header = json.loads(_b64decode(header_seg))
+        if not isinstance(header, dict):
+            raise JWTError("Invalid header")
+        if header != _FAST_HEADER:
+            return jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        expected = hmac.new(
+            JWT_SECRET.encode(),
+            f"{header_seg}.{payload_seg}".encode(),
+            hashlib.sha256,
+        ).digest()
+        if not hmac.compare_digest(_b64decode(sig_seg), expected):
+            raise JWTError("Signature verification failed")
+        payload = json.loads(_b64decode(payload_seg))
+        if not isinstance(payload, dict):
+            raise JWTError("Invalid payload")
+    except JWTError:
+        raise
+    except Exception as e:
+        raise JWTError(f"Malformed token: {e}")
+    if not payload.keys() <= _FAST_CLAIMS:
+        return jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise JWTError("Subject must be a string")
+    exp = payload.get("exp")
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)) or exp <= time.time():
+        raise JWTError("Token is expired")
+    return payload
+
+def _stream_ticket_signature(body: str) -> str:
+    # Keyed apart from access tokens so neither can stand in for the other
+    digest = hmac.new(
+        f"stream-ticket:{JWT_SECRET}".encode(), body.encode(), hashlib.sha256
+    ).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+def create_stream_ticket(uid: int) -> str:
+    body = f"{uid}.{int(time.time()) + STREAM_TICKET_SECONDS}"
+    return f"{body}.{_stream_ticket_signature(body)}"
+
+def decode_stream_ticket(ticket: str) -> Optional[int]:
+    """
+    Returns the user id of a valid, unexpired stream ticket, else None.
+    """
+    try:
+        uid, exp, sig = ticket.split(".")
+        if not hmac.compare_digest(sig, _stream_ticket_signature(f"{uid}.{exp}")):
+            return None
+        if int(exp) <= time.time():
+            return None
+        return int(uid)
+    except ValueError:
+        return None
+
 def decode_access_token(token: str) -> dict:
     """
     Decode JWT and return the payload.
     Raises JWTError if invalid/expired.
     """
+    if JWT_ALG == "HS256":
+        return decode_hs256(token)
     payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALG])
-    return payload
\ No newline at end of file
+    return payload
@@ -1,22 +1,118 @@
-from fastapi import Depends, HTTPException, status
+import hashlib, os, time
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from security import decode_access_token
+from prisma.prisma_client import Prisma
+from prisma.prisma_client.models import User
+from cache import TTLCache
+from dependencies import get_db
+from security import decode_access_token, decode_stream_ticket
 
 auth_scheme = HTTPBearer(auto_error=False)
 
-def get_current_user_email(
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "600"))
+# Comma-separated emails allowed to read operational endpoints like
+# /metrics/hashing; empty means nobody.
+ADMIN_EMAILS = {
+    x.strip().lower() for x in os.getenv("ADMIN_EMAILS", "").split(",") if x.strip()
+}
+
+# email -> User, so requests with older tokens that carry no "uid" claim
+# (and /me, which needs the whole row) skip the lookup on a hit.
+_user_cache = TTLCache(USER_CACHE_SIZE, USER_CACHE_TTL)
+
+# sha256(token) -> verified payload. Entries never outlive the token's exp.
+_token_cache = TTLCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
+
+def invalidate_user(email: str) -> None:
+    """
+    Drop a cached user. Call after anything that changes or removes a User.
+    """
+    _user_cache.pop(email)
+
+def _payload_from_token(token: str) -> dict:
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(digest)
+    if payload is not None:
+        return payload
+
+    try:
+        payload = decode_access_token(token)
+    except Exception:
+        payload = None
+    if not payload or not payload.get("sub"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        )
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(TOKEN_CACHE_TTL, exp - time.time())
+        if ttl > 0:
+            _token_cache.set(digest, payload, ttl)
+    return payload
+
+def get_token_payload(
     creds: HTTPAuthorizationCredentials = Depends(auth_scheme),
-) -> str:
+) -> dict:
     if not creds:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
-    try:
-        payload = decode_access_token(creds.credentials)
-        return payload["sub"]
-    except Exception:
+    return _payload_from_token(creds.credentials)
+
+def get_current_user_email(payload: dict = Depends(get_token_payload)) -> str:
+    return payload["sub"]
+
+def require_admin(email: str = Depends(get_current_user_email)) -> str:
+    if email.lower() not in ADMIN_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required",
+        )
+    return email
+
+async def _resolve_user(email: str, db: Prisma) -> User:
+    user = _user_cache.get(email)
+    if user is None:
+        user = await db.user.find_unique(where={"email": email})
+        if not user:
+            raise HTTPException(404, "User not found")
+        _user_cache.set(email, user)
+    return user
+
+async def _resolve_user_id(payload: dict, db: Prisma) -> int:
+    uid = payload.get("uid")
+    if isinstance(uid, int):
+        return uid
+    return (await _resolve_user(payload["sub"], db)).id
+
+async def get_current_user(
+    payload: dict = Depends(get_token_payload),
+    db: Prisma = Depends(get_db),
+) -> User:
+    return await _resolve_user(payload["sub"], db)
+
+async def get_current_user_id(
+    payload: dict = Depends(get_token_payload),
+    db: Prisma = Depends(get_db),
+) -> int:
+    return await _resolve_user_id(payload, db)
+
+def get_stream_user_id(ticket: str = Query(...)) -> int:
+    """
+    The browser EventSource API cannot send an Authorization header, so the
+    stream authenticates with a short-lived ticket from
+    POST /notifications/stream-ticket instead of the access token.
+    """
+    uid = decode_stream_ticket(ticket)
+    if uid is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token",
+            detail="Invalid stream ticket",
         )
+    return uid
@@ -0,0 +1,49 @@
+from typing import Dict, Iterable
+from prisma.prisma_client import Prisma
+
+# EventSource.domain -> EventSource.id. The set of domains is small and rows
+# are never deleted, so entries do not expire.
+_source_ids: Dict[str, int] = {}
+
+
+async def warm_source_cache(db: Prisma) -> None:
+    for src in await db.eventsource.find_many():
+        _source_ids[src.domain] = src.id
+
+
+async def resolve_source_id(db: Prisma, domain: str) -> int:
+    source_id = _source_ids.get(domain)
+    if source_id is None:
+        source = await db.eventsource.upsert(
+            where={"domain": domain},
+            data={
+                "create": {"domain": domain, "label": domain},
+                "update": {},
+            }
+        )
+        source_id = _source_ids[domain] = source.id
+    return source_id
+
+
+async def resolve_source_ids(db: Prisma, domains: Iterable[str]) -> Dict[str, int]:
+    """
+    Resolve many domains at once; misses are upserted in one batched
+    transaction and read back with one query.
+    """
+    domains = set(domains)
+    missing = [d for d in domains if d not in _source_ids]
+    if missing:
+        async with db.batch_() as batch:
+            for domain in missing:
+                batch.eventsource.upsert(
+                    where={"domain": domain},
+                    data={
+                        "create": {"domain": domain, "label": domain},
+                        "update": {},
+                    }
+                )
+        for src in await db.eventsource.find_many(
+            where={"domain": {"in": missing}}
+        ):
+            _source_ids[src.domain] = src.id
+    return {d: _source_ids[d] for d in domains}
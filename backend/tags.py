@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, List
+from prisma.prisma_client import Prisma
+
+# Tag.name -> Tag.id. Tags come from a small fixed vocabulary
+# (attendance mode, event status), so entries do not expire.
+_tag_ids: Dict[str, int] = {}
+
+
+async def resolve_tag_ids(db: Prisma, names: Iterable[str]) -> Dict[str, int]:
+    """
+    Resolve tag names to ids; unknown names are upserted in one batched
+    transaction and read back with one query.
+    """
+    names = set(names)
+    missing = [n for n in names if n not in _tag_ids]
+    if missing:
+        async with db.batch_() as batch:
+            for name in missing:
+                batch.tag.upsert(
+                    where={"name": name},
+                    data={"create": {"name": name}, "update": {}},
+                )
+        for tag in await db.tag.find_many(where={"name": {"in": missing}}):
+            _tag_ids[tag.name] = tag.id
+    return {n: _tag_ids[n] for n in names}
+
+
+def tag_relation(tag_ids: List[int]) -> Dict[str, dict]:
+    """
+    Event.tags fields to merge into create/update data; an update replaces
+    the event's tags with the ones just scraped.
+    """
+    refs = [{"id": i} for i in tag_ids]
+    return {
+        "create": {"tags": {"connect": refs}} if refs else {},
+        "update": {"tags": {"set": refs}},
+    }
@@ -0,0 +1,129 @@
+"""
+Trusted hydration builds models with an exec-compiled constructor that sets
+pydantic's private attributes directly, so check it against model_parse for
+the rows the query engine returns.
+
+    cd backend && python -m pytest tests/test_hydration.py
+"""
+import pytest
+
+from prisma.prisma_client import models
+from prisma.prisma_client._compat import model_parse
+from prisma.prisma_client._hydration import hydrate, hydrate_many
+
+WHEN = "2025-06-01T18:00:00.000Z"
+
+
+def venue_row(i=1):
+    return {
+        "id": i,
+        "name": "Venue",
+        "street": None,
+        "city": "Lagos",
+        "state": None,
+        "country": "NG",
+        "lat": 6,
+        "lng": 3.4,
+        "key": None,
+        "createdAt": WHEN,
+    }
+
+
+def event_row(i=1, include=False):
+    row = {
+        "id": i,
+        "title": f"Event number {i}",
+        "description": None,
+        "url": f"https://example.com/events/{i}",
+        "imageUrl": None,
+        "startTime": WHEN,
+        "endTime": None,
+        "timezone": "Africa/Lagos",
+        "price": "12.50",
+        "isFree": False,
+        "venueId": 1,
+        "sourceId": None,
+        "createdAt": WHEN,
+        "updatedAt": "2025-05-02T09:30:00.123456Z",
+    }
+    if include:
+        row["venue"] = venue_row()
+        row["tags"] = [{"id": 1, "name": "music"}, {"id": 2, "name": "art"}]
+    return row
+
+
+def notification_row(include=False):
+    row = {
+        "id": 1,
+        "userId": 2,
+        "eventId": 3,
+        "type": "EVENT_UPCOMING_1",
+        "message": "Starts soon",
+        "createdAt": WHEN,
+        "readAt": None,
+    }
+    if include:
+        row["event"] = event_row(3, include=True)
+    return row
+
+
+def assert_same(hydrated, parsed):
+    assert type(hydrated) is type(parsed)
+    assert hydrated == parsed
+    assert list(hydrated.__dict__) == list(parsed.__dict__)
+    assert hydrated.model_fields_set == parsed.model_fields_set
+    assert hydrated.__pydantic_extra__ == parsed.__pydantic_extra__
+    assert hydrated.__pydantic_private__ == parsed.__pydantic_private__
+    assert hydrated.model_dump() == parsed.model_dump()
+    assert hydrated.model_dump_json() == parsed.model_dump_json()
+
+
+CASES = {
+    "event": (models.Event, event_row()),
+    "event with relations": (models.Event, event_row(include=True)),
+    "event with empty relations": (models.Event, {**event_row(), "venue": None, "tags": []}),
+    "venue": (models.Venue, venue_row()),
+    "tag": (models.Tag, {"id": 1, "name": "music"}),
+    "notification": (models.Notification, notification_row()),
+    "notification with nested relations": (models.Notification, notification_row(include=True)),
+    "unknown keys": (models.Tag, {"id": 1, "name": "music", "_count": {"events": 2}}),
+    "missing optional fields": (models.Event, {
+        "id": 1, "title": "T", "url": "https://example.com/t", "createdAt": WHEN, "updatedAt": WHEN,
+    }),
+}
+
+
+@pytest.mark.parametrize("case", list(CASES.values()), ids=list(CASES))
+def test_hydrate_matches_model_parse(case):
+    model, row = case
+    assert_same(hydrate(model, row), model_parse(model, row))
+
+
+def test_hydrate_many_matches_model_parse():
+    rows = [event_row(i, include=i % 2 == 0) for i in range(5)]
+    hydrated = hydrate_many(models.Event, rows)
+    assert len(hydrated) == len(rows)
+    for instance, row in zip(hydrated, rows):
+        assert_same(instance, model_parse(models.Event, row))
+
+
+def test_hydrate_subclasses():
+    class Listing(models.Event):
+        note: str = "none"
+
+    class Private(models.Tag):
+        _seen: bool = False
+
+    assert_same(hydrate(Listing, event_row(include=True)), model_parse(Listing, event_row(include=True)))
+    tag = {"id": 1, "name": "music"}
+    hydrated = hydrate(Private, tag)
+    assert_same(hydrated, model_parse(Private, tag))
+    assert hydrated._seen is False
+
+
+def test_hydrated_instances_are_independent():
+    first, second = hydrate_many(models.Event, [event_row(1), event_row(2)])
+    first.title = "Changed"
+    assert second.title == "Event number 2"
+    assert first.__dict__ is not second.__dict__
+    assert first.model_fields_set is not second.model_fields_set
@@ -0,0 +1,131 @@
+"""
+Queries filled from a cached template must match a full render of the
+node tree byte for byte, including on the second (cached) call.
+
+    cd backend && python -m pytest tests/test_query_templates.py
+"""
+import datetime, decimal
+
+import pytest
+
+from prisma.prisma_client import fields, models
+from prisma.prisma_client._builder import QueryBuilder
+from prisma.prisma_client.metadata import PRISMA_MODELS, RELATIONAL_FIELD_MAPPINGS
+
+SLOT = "__prisma_slot_0__"
+WHEN = datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc)
+
+CASES = {
+    "raw params": (
+        "query_raw",
+        {"query": "SELECT $1, $2, $3", "parameters": [1, 'a"b\n', WHEN]},
+        None,
+        None,
+    ),
+    "raw without params": ("execute_raw", {"query": "DELETE", "parameters": []}, None, None),
+    "raw slot literal": (
+        "query_raw",
+        {"query": f"SELECT '{SLOT}'", "parameters": [SLOT, "__prisma_slot_1__"]},
+        None,
+        None,
+    ),
+    "empty lists": (
+        "find_many",
+        {"where": {"id": {"in": []}, "tags": {"some": {"name": {"in": []}}}}, "order_by": []},
+        models.Event,
+        None,
+    ),
+    "scalar list": ("find_many", {"where": {"id": {"in": [1, 2, 3]}}}, models.User, None),
+    "scalar tuple and set": (
+        "update_many",
+        {"data": {"read": True}, "where": {"id": {"in": (1, 2)}, "userId": {"in": {5}}}},
+        None,
+        ["count"],
+    ),
+    "nested includes": (
+        "find_many",
+        {
+            "where": {"startTime": {"gte": WHEN}, "city": None},
+            "take": 50,
+            "skip": None,
+            "include": {
+                "venue": True,
+                "source": {"where": None},
+                "tags": {"take": 3, "include": {"events": {"include": {"venue": True}}}},
+                "savedBy": False,
+            },
+        },
+        models.Event,
+        None,
+    ),
+    "lists of dicts": (
+        "create_many",
+        {
+            "data": [
+                {"userId": 1, "eventId": 2, "type": "EVENT_SOON", "message": "m"},
+                {"userId": 1, "eventId": None, "type": "EVENT_SOON", "message": SLOT},
+            ],
+            "skip_duplicates": True,
+        },
+        models.Notification,
+        ["count"],
+    ),
+    "order by list": (
+        "find_many",
+        {"order_by": [{"startTime": "asc"}, {"id": "desc"}], "cursor": {"id": 4}},
+        models.Event,
+        None,
+    ),
+    "nested connect": (
+        "create",
+        {
+            "data": {
+                "title": "T",
+                "url": "https://example.com/t",
+                "price": decimal.Decimal("1.50"),
+                "tags": {"connect": [{"id": 1}, {"id": 2}]},
+                "venue": {"connect": {"id": 3}},
+            }
+        },
+        models.Event,
+        None,
+    ),
+    "slot literal value": (
+        "find_first",
+        {"where": {"name": SLOT, "city": {"contains": "__prisma_slot_7__"}}},
+        models.Venue,
+        None,
+    ),
+    "slot literal json": (
+        "find_first",
+        {"where": {"key": fields.Json({SLOT: [SLOT, 1]})}},
+        models.Venue,
+        None,
+    ),
+    "no arguments": ("find_many", {}, models.Tag, None),
+}
+
+
+def build(method, arguments, model, root_selection):
+    return QueryBuilder(
+        method=method,
+        arguments=arguments,
+        model=model,
+        root_selection=root_selection,
+        prisma_models=PRISMA_MODELS,
+        relational_field_mappings=RELATIONAL_FIELD_MAPPINGS,
+    )
+
+
+@pytest.mark.parametrize("case", list(CASES.values()), ids=list(CASES))
+def test_template_matches_full_render(case):
+    expected = build(*case)._render(pretty=False)
+    # the first call compiles the template, the second fills the cached one
+    assert build(*case)._render_from_template(pretty=False) == expected
+    assert build(*case)._render_from_template(pretty=False) == expected
+
+
+def test_scalar_lists_of_any_length_share_a_template():
+    for ids in ([], [1], [1, 2, 3], list(range(100))):
+        case = ("find_many", {"where": {"id": {"in": ids}, "email": {"not": SLOT}}}, models.User, None)
+        assert build(*case)._render_from_template(pretty=False) == build(*case)._render(pretty=False)
@@ -0,0 +1,86 @@
+"""
+Runs against the Postgres database in DATABASE_URL with the migrations
+applied, and is skipped when it is unset:
+
+    cd backend && DATABASE_URL=postgresql://... python -m pytest tests
+"""
+import asyncio, os, uuid
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DATABASE_URL"), reason="needs a Postgres DATABASE_URL"
+)
+
+
+def test_compact_venues_repoints_events_through_array_binding():
+    from prisma.prisma_client import Prisma
+    from venues import compact_venues, venue_key
+
+    async def run():
+        db = Prisma()
+        await db.connect()
+        marker = uuid.uuid4().hex
+        venue = {"name": f"Hall {marker}", "city": "Lagos"}
+        try:
+            # Three spellings of one venue, written before keys existed
+            ids = [
+                (await db.venue.create(data={**venue, "name": name})).id
+                for name in (venue["name"], venue["name"].upper(), f" {venue['name']}! ")
+            ]
+            events = [
+                await db.event.create(data={
+                    "title": "Launch",
+                    "url": f"https://example.com/{marker}/{i}",
+                    "venue": {"connect": {"id": venue_id}},
+                })
+                for i, venue_id in enumerate(ids)
+            ]
+
+            await compact_venues(db)
+
+            rows = await db.event.find_many(
+                where={"id": {"in": [ev.id for ev in events]}}
+            )
+            assert {ev.venueId for ev in rows} == {ids[0]}
+            kept = await db.venue.find_many(where={"id": {"in": ids}})
+            assert [(v.id, v.key) for v in kept] == [(ids[0], venue_key(venue))]
+        finally:
+            await db.event.delete_many(where={"url": {"startswith": f"https://example.com/{marker}/"}})
+            await db.venue.delete_many(where={"name": {"contains": marker, "mode": "insensitive"}})
+            await db.disconnect()
+
+    asyncio.run(run())
+
+
+def test_compact_venues_keeps_the_row_that_already_has_the_key():
+    from prisma.prisma_client import Prisma
+    from venues import compact_venues, venue_key
+
+    async def run():
+        db = Prisma()
+        await db.connect()
+        marker = uuid.uuid4().hex
+        venue = {"name": f"Hall {marker}", "city": "Lagos"}
+        try:
+            # An older unkeyed row, and a newer one resolve_venue_id created
+            older = await db.venue.create(data={**venue, "name": venue["name"].upper()})
+            keyed = await db.venue.create(data={**venue, "key": venue_key(venue)})
+            event = await db.event.create(data={
+                "title": "Launch",
+                "url": f"https://example.com/{marker}/0",
+                "venue": {"connect": {"id": older.id}},
+            })
+
+            await compact_venues(db)
+
+            row = await db.event.find_unique(where={"id": event.id})
+            assert row.venueId == keyed.id
+            kept = await db.venue.find_many(where={"id": {"in": [older.id, keyed.id]}})
+            assert [v.id for v in kept] == [keyed.id]
+        finally:
+            await db.event.delete_many(where={"url": {"startswith": f"https://example.com/{marker}/"}})
+            await db.venue.delete_many(where={"name": {"contains": marker, "mode": "insensitive"}})
+            await db.disconnect()
+
+    asyncio.run(run())
@@ -0,0 +1,169 @@
+import asyncio, hashlib, os, re, unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional
+from prisma.prisma_client import Prisma
+
+from cache import TTLCache
+
+VENUE_CACHE_SIZE = int(os.getenv("VENUE_CACHE_SIZE", "5000"))
+VENUE_CACHE_TTL = float(os.getenv("VENUE_CACHE_TTL_SECONDS", "3600"))
+# 3 decimal places is roughly 100 m, enough to absorb geocoder jitter
+GEO_PRECISION = 3
+
+VENUE_FIELDS = ("name", "street", "city", "state", "country", "lat", "lng")
+
+# venue key -> Venue.id for recently resolved venues
+_venue_ids = TTLCache(VENUE_CACHE_SIZE, VENUE_CACHE_TTL)
+
+
+def _norm(value: Any) -> str:
+    if not value:
+        return ""
+    text = unicodedata.normalize("NFKD", str(value))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+def _norm_geo(value: Any) -> str:
+    if value is None:
+        return ""
+    return f"{round(float(value), GEO_PRECISION):.{GEO_PRECISION}f}"
+
+
+def venue_key(v: Dict[str, Any]) -> Optional[str]:
+    """
+    Canonical identity for a scraped venue: case, accents, punctuation and
+    whitespace are folded and coordinates rounded to GEO_PRECISION. Returns
+    None when there is nothing to identify the venue by.
+    """
+    parts = [_norm(v.get(f)) for f in ("name", "street", "city", "state", "country")]
+    parts += [_norm_geo(v.get("lat")), _norm_geo(v.get("lng"))]
+    if not any(parts):
+        return None
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def _venue_data(v: Dict[str, Any], key: str) -> Dict[str, Any]:
+    return {**{f: v.get(f) for f in VENUE_FIELDS}, "key": key}
+
+
+async def resolve_venue_id(db: Prisma, v: Dict[str, Any]) -> Optional[int]:
+    key = venue_key(v)
+    if key is None:
+        return None
+    venue_id = _venue_ids.get(key)
+    if venue_id is None:
+        venue = await db.venue.upsert(
+            where={"key": key},
+            data={"create": _venue_data(v, key), "update": {}},
+        )
+        venue_id = venue.id
+        _venue_ids.set(key, venue_id)
+    return venue_id
+
+
+def forget_venue(v: Dict[str, Any]) -> None:
+    """
+    Drop a venue's cached id, e.g. after a connect to it failed because
+    compact_venues merged the row away in another process.
+    """
+    key = venue_key(v)
+    if key is not None:
+        _venue_ids.pop(key)
+
+
+async def resolve_venue_ids(
+    db: Prisma, venues: Iterable[Dict[str, Any]]
+) -> Dict[str, int]:
+    """
+    Resolve many venues at once: cache hits are free, misses are upserted in
+    one batched transaction and read back with one query. Returns key -> id.
+    """
+    out: Dict[str, int] = {}
+    missing: Dict[str, Dict[str, Any]] = {}
+    for v in venues:
+        key = venue_key(v)
+        if key is None or key in out or key in missing:
+            continue
+        venue_id = _venue_ids.get(key)
+        if venue_id is None:
+            missing[key] = v
+        else:
+            out[key] = venue_id
+
+    if missing:
+        async with db.batch_() as batch:
+            for key, v in missing.items():
+                batch.venue.upsert(
+                    where={"key": key},
+                    data={"create": _venue_data(v, key), "update": {}},
+                )
+        for venue in await db.venue.find_many(
+            where={"key": {"in": list(missing)}}
+        ):
+            out[venue.key] = venue.id
+            _venue_ids.set(venue.key, venue.id)
+    return out
+
+
+async def compact_venues(db: Prisma, page_size: int = 1000) -> int:
+    """
+    One-off job: assign keys to existing venues, merge rows that share a key
+    and repoint Event.venueId. Returns rows removed.
+
+    Each group keeps the row that already has its key, as that is the id the
+    API workers resolve and cache for new scrapes; otherwise the oldest row.
+    """
+    groups = defaultdict(list)
+    keyed: Dict[str, int] = {}
+    last_id = 0
+    while True:
+        page = await db.venue.find_many(
+            where={"id": {"gt": last_id}},
+            order={"id": "asc"},
+            take=page_size,
+        )
+        if not page:
+            break
+        for venue in page:
+            key = venue_key(venue.model_dump())
+            if key is not None:
+                groups[key].append(venue.id)
+                if venue.key == key:
+                    keyed[key] = venue.id
+        last_id = page[-1].id
+
+    removed = 0
+    for key, ids in groups.items():
+        keep = keyed.get(key, ids[0])
+        dupes = [i for i in ids if i != keep]
+        async with db.tx() as tx:
+            if dupes:
+                # The typed update_many input has no venueId, so repoint the
+                # events in one raw statement; tests/test_venues.py checks
+                # the list binds as an int[] on Postgres.
+                await tx.execute_raw(
+                    'UPDATE "Event" SET "venueId" = $1 WHERE "venueId" = ANY($2::int[])',
+                    keep,
+                    dupes,
+                )
+                removed += await tx.venue.delete_many(where={"id": {"in": dupes}})
+            if keyed.get(key) != keep:
+                await tx.venue.update(where={"id": keep}, data={"key": key})
+    _venue_ids.clear()
+    return removed
+
+
+async def _main() -> None:
+    db = Prisma()
+    await db.connect()
+    try:
+        removed = await compact_venues(db)
+        print(f"Merged {removed} duplicate venues")
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -9,7 +9,81 @@ function NotificationsBell() {
   const [notifications, setNotifications] = useState([]);
   const [isOpen, setIsOpen] = useState(false);
   const [isLoading, setIsLoading] = useState(false);
+  const [unreadCount, setUnreadCount] = useState(0);
   const navigate = useNavigate();
+
+  const fetchUnreadCount = async () => {
+    const token = getToken();
+    if (!token) return;
+
+    try {
+      const res = await fetch(`${API_BASE}/notifications/unread-count`, {
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      });
+      if (!res.ok) return;
+      const data = await res.json();
+      setUnreadCount(data.count || 0);
+    } catch (err) {
+      console.error("Error fetching unread count:", err);
+    }
+  };
+
+  useEffect(() => {
+    fetchUnreadCount();
+
+    if (!getToken()) return;
+
+    let stream = null;
+    let retry = null;
+    let closed = false;
+
+    // EventSource can't send an Authorization header, so the stream is
+    // opened with a short-lived ticket rather than the access token. A
+    // ticket only has to be valid when connecting, so every reconnect
+    // asks for a fresh one instead of relying on EventSource's own retry.
+    const connect = async () => {
+      try {
+        const res = await fetch(`${API_BASE}/notifications/stream-ticket`, {
+          method: "POST",
+          headers: {
+            Authorization: `Bearer ${getToken()}`,
+          },
+        });
+        if (!res.ok || closed) return;
+        const { ticket } = await res.json();
+        if (closed) return;
+
+        stream = new EventSource(
+          `${API_BASE}/notifications/stream?ticket=${encodeURIComponent(ticket)}`
+        );
+        // The list itself is re-fetched when the dropdown opens; pushes only
+        // need to keep the badge current.
+        stream.addEventListener("notification", () => {
+          setUnreadCount((c) => c + 1);
+        });
+        stream.onerror = () => {
+          stream.close();
+          if (!closed) {
+            fetchUnreadCount();
+            retry = setTimeout(connect, 5000);
+          }
+        };
+      } catch (err) {
+        console.error("Error opening notification stream:", err);
+        if (!closed) retry = setTimeout(connect, 5000);
+      }
+    };
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(retry);
+      if (stream) stream.close();
+    };
+  }, []);
+
   const fetchNotifications = async () => {
     const token = getToken();
     if (!token) return [];
@@ -48,21 +122,22 @@ function NotificationsBell() {
     if (unread.length === 0) return;
 
     try {
-      await Promise.all(
-        unread.map((notif) =>
-          fetch(`${API_BASE}/notifications/${notif.id}/read`, {
-            method: "POST",
-            headers: {
-              Authorization: `Bearer ${token}`,
-            },
-          })
-        )
-      );
+      await fetch(`${API_BASE}/notifications/read`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          Authorization: `Bearer ${token}`,
+        },
+        body: JSON.stringify({
+          before: Math.max(...unread.map((n) => n.id)),
+        }),
+      });
       setNotifications((prev) =>
         prev.map((n) =>
           n.readAt ? n : { ...n, readAt: new Date().toISOString() }
         )
       );
+      setUnreadCount(0);
     } catch (err) {
       console.error("Error marking notifications as read:", err);
     }
@@ -78,8 +153,6 @@ function NotificationsBell() {
     }
   };
 
-  const unreadCount = notifications.filter((n) => !n.readAt).length;
-
   const formatDateTime = (isoString) => {
     if (!isoString) return "";
     return new Date(isoString).toLocaleString();